@@ -0,0 +1,21 @@
+"""
+Test settings for bill_engine project.
+
+Always runs against an in-memory SQLite database so the suite does not depend on
+(or pay the per-transaction commit cost of) a local PostgreSQL server.
+"""
+
+from .local import *  # noqa: F403, F401
+
+DATABASES = {
+    "default": {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": ":memory:",
+        "TEST": {"NAME": ":memory:"},
+        # Keep base's per-request transactions so view tests see production behaviour
+        "ATOMIC_REQUESTS": True,
+    }
+}
+
+# Fast hashing for any tests that create users
+PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
@@ -5,6 +5,7 @@ This module provides lightweight mappings from the tariffs app's Django models
 to the immutable dataclasses used by the billing engine core.
 """
 
+from functools import lru_cache
 from uuid import UUID, uuid5
 
 from billing.core.types import (
@@ -39,12 +40,14 @@ from tariffs.models import (
 BILLING_CHARGE_NAMESPACE = UUID("a1b2c3d4-e5f6-7890-abcd-ef1234567890")
 
 
+@lru_cache(maxsize=4096)
 def generate_charge_id(model_name: str, pk: int) -> ChargeId:
     """
     Generate a deterministic ChargeId from a Django model's primary key.
 
     Uses UUID5 to create stable, reproducible UUIDs that maintain lineage
-    across multiple conversions of the same database record.
+    across multiple conversions of the same database record. Results are
+    memoized since ChargeId is immutable and a pure function of the inputs.
 
     Args:
         model_name: Name of the Django model (e.g., "EnergyCharge")
@@ -4,67 +4,209 @@ Helper functions for deciding when a charge is applicable.
 
 from __future__ import annotations
 
-from datetime import date
+from dataclasses import dataclass
+from datetime import date, time
+from functools import lru_cache
 
+import numpy as np
 import pandas as pd
 
 from .types import ApplicabilityRule, DayType
+from .util import _local_wall_clock
+
+_NS_PER_SECOND = 1_000_000_000
+
+
+def _time_of_day_ns(t: time) -> int:
+    """Convert a clock time to nanoseconds since midnight."""
+    seconds = t.hour * 3600 + t.minute * 60 + t.second
+    return seconds * _NS_PER_SECOND + t.microsecond * 1000
+
+
+def _times_of_day_ns(local_starts: np.ndarray) -> np.ndarray:
+    """Vectorized _time_of_day_ns over naive datetime64 values."""
+    midnights = local_starts.astype("datetime64[D]")
+    return (local_starts - midnights).astype("timedelta64[ns]").view("int64")
+
+
+_NS_PER_MINUTE = 60 * _NS_PER_SECOND
+_MINUTES_PER_DAY = 24 * 60
+
+
+def _minutes_of_day(time_of_day_ns: np.ndarray) -> np.ndarray | None:
+    """
+    Convert nanoseconds since midnight to minute-of-day indices.
+
+    Returns None if any interval does not start on a whole minute.
+    """
+    if np.any(time_of_day_ns % _NS_PER_MINUTE):
+        return None
+    return (time_of_day_ns // _NS_PER_MINUTE).astype(np.int16)
+
+
+@lru_cache(maxsize=256)
+def _time_window_lut(start: time | None, end: time | None) -> np.ndarray | None:
+    """
+    Build a minute-of-day lookup table for a [start, end) time window.
+
+    Returns None if either bound does not fall on a whole minute. A missing bound means
+    the beginning or end of the day, respectively. The table is shared between calls, so
+    it is marked read-only.
+    """
+    bounds = [t for t in (start, end) if t is not None]
+    if any(t.second or t.microsecond for t in bounds):
+        return None
+    start_minute = start.hour * 60 + start.minute if start is not None else 0
+    end_minute = end.hour * 60 + end.minute if end is not None else _MINUTES_PER_DAY
+    lut = np.zeros(_MINUTES_PER_DAY, dtype=bool)
+    lut[start_minute:end_minute] = True
+    lut.flags.writeable = False
+    return lut
+
+
+def _month_day_key(d: date) -> int:
+    """Encode the month and day of a date as a sortable integer (e.g. Jan 15 -> 115)."""
+    return d.month * 100 + d.day
+
+
+def _month_day_keys(local_starts: np.ndarray) -> np.ndarray:
+    """
+    Vectorized _month_day_key over naive datetime64 values.
+
+    Stays in integer arithmetic on datetime64 unit casts so no Python date objects are
+    created per row.
+    """
+    days = local_starts.astype("datetime64[D]")
+    months = local_starts.astype("datetime64[M]")
+    month_of_year = months.view("int64") % 12 + 1
+    day_of_month = (days - months.astype("datetime64[D]")).view("int64") + 1
+    return month_of_year * 100 + day_of_month
+
+
+# Bit assigned to each day type in the packed per-interval day-type mask
+_DAY_TYPE_BITS = {
+    DayType.WEEKDAY: 1 << 0,
+    DayType.WEEKEND: 1 << 1,
+    DayType.HOLIDAY: 1 << 2,
+}
+
+
+def _day_type_bits(day_types: frozenset[DayType]) -> int:
+    """Pack a set of day types into the bit layout used by _IntervalFields.day_bits."""
+    bits = 0
+    for day_type in day_types:
+        bits |= _DAY_TYPE_BITS[day_type]
+    return bits
+
+
+def _pack_day_bits(usage: pd.DataFrame) -> np.ndarray:
+    """Pack the is_weekday/is_weekend/is_holiday flags of each interval into a uint8."""
+    day_bits = np.zeros(len(usage), dtype=np.uint8)
+    for day_type, column in (
+        (DayType.WEEKDAY, "is_weekday"),
+        (DayType.WEEKEND, "is_weekend"),
+        (DayType.HOLIDAY, "is_holiday"),
+    ):
+        day_bits[usage[column].to_numpy(dtype=bool)] |= _DAY_TYPE_BITS[day_type]
+    return day_bits
+
+
+@dataclass(frozen=True, slots=True)
+class _IntervalFields:
+    """Per-interval arrays derived once from a usage frame and shared by every rule."""
+
+    day_bits: np.ndarray
+    time_of_day_ns: np.ndarray
+    minutes_of_day: np.ndarray | None
+    month_day_keys: np.ndarray
+
+    @classmethod
+    def from_usage(cls, usage: pd.DataFrame, day_bits: np.ndarray) -> _IntervalFields:
+        """
+        Pack day-type flags into a uint8 bit mask and derive local time/date fields.
+
+        Args:
+            usage: dataframe with columns interval_start, is_weekday, is_weekend, is_holiday
+                (other columns are ignored).
+            day_bits: day-type flags of usage, as packed by _pack_day_bits.
+        """
+        # Applicability rules are written in local wall-clock time
+        local_starts = _local_wall_clock(pd.to_datetime(usage["interval_start"], utc=False))
+        time_of_day_ns = _times_of_day_ns(local_starts)
+        return cls(
+            day_bits=day_bits,
+            time_of_day_ns=time_of_day_ns,
+            minutes_of_day=_minutes_of_day(time_of_day_ns),
+            month_day_keys=_month_day_keys(local_starts),
+        )
+
+
+_ALL_DAY_TYPES = frozenset(DayType)
+
+
+def _is_unconstrained(rule: ApplicabilityRule) -> bool:
+    """
+    Whether a rule has no constraints (all day types, no time or date bounds).
+
+    Such a rule matches every interval that has at least one day-type flag set.
+    """
+    return rule.day_types == _ALL_DAY_TYPES and not (
+        rule.period_start_local or rule.period_end_local or rule.start_date or rule.end_date
+    )
 
 
 def _construct_single_rule_mask(
-    usage: pd.DataFrame, rule: ApplicabilityRule
-) -> pd.Series[bool]:
+    fields: _IntervalFields,
+    rule: ApplicabilityRule,
+    rule_mask: np.ndarray,
+    scratch: np.ndarray,
+) -> np.ndarray:
     """
     Construct applicability mask for a single rule.
 
     Args:
-        usage: dataframe with columns interval_start, is_weekday, is_weekend, is_holiday
-            (other columns are ignored).
+        fields: per-interval fields derived from the usage dataframe
         rule: the rule to apply
+        rule_mask: bool array the mask is written into (overwritten)
+        scratch: bool array of the same length used for intermediate comparisons
+            (overwritten)
 
     Returns:
-        A bool series with the same index as the provided dataframe where each row is
-        True if the rule applies to that interval.
+        rule_mask, where each element is True if the rule applies to that interval.
     """
-    # Apply day-of-week rules first, then subtract out-of-bounds times/dates
-    rule_mask = pd.Series(False, index=usage.index)
-    if DayType.WEEKDAY in rule.day_types:
-        rule_mask[usage["is_weekday"]] = True
-    if DayType.WEEKEND in rule.day_types:
-        rule_mask[usage["is_weekend"]] = True
-    if DayType.HOLIDAY in rule.day_types:
-        rule_mask[usage["is_holiday"]] = True
-
-    # Make sure we have intervals as datetimes to work with
-    interval_starts = pd.to_datetime(usage["interval_start"].copy(), utc=False)
-    interval_start_times = interval_starts.dt.time
+    # Apply day-of-week rules first (one test against the packed day-type bits), then
+    # subtract out-of-bounds times/dates
+    np.not_equal(fields.day_bits & _day_type_bits(rule.day_types), 0, out=rule_mask)
+
+    # Each bound is evaluated into the scratch buffer and folded into rule_mask in place,
+    # so no per-predicate temporaries are allocated
 
     # Permissive approach: if either the start or end time is None, treat it as the
     # beginning or end of the day, respectively
-    if rule.period_start_local:
-        rule_mask[~(rule.period_start_local <= interval_start_times)] = False
-    if rule.period_end_local:
-        rule_mask[~(interval_start_times < rule.period_end_local)] = False
-
-    # Normalize dates to year 2000 for month/day-only comparison
-    # This allows rules to match dates regardless of the actual year
-    if rule.start_date or rule.end_date:
-        # Vectorized date normalization: create timestamps with year 2000
-        interval_dates_normalized = pd.to_datetime(
-            {"year": 2000, "month": interval_starts.dt.month, "day": interval_starts.dt.day}
-        )
-        if rule.start_date:
-            # Normalize rule start_date to year 2000 as well
-            rule_start_normalized = pd.Timestamp(
-                year=2000, month=rule.start_date.month, day=rule.start_date.day
-            )
-            rule_mask &= interval_dates_normalized >= rule_start_normalized
-        if rule.end_date:
-            # Normalize rule end_date to year 2000 as well
-            rule_end_normalized = pd.Timestamp(
-                year=2000, month=rule.end_date.month, day=rule.end_date.day
-            )
-            rule_mask &= interval_dates_normalized <= rule_end_normalized
+    period_start = rule.period_start_local
+    period_end = rule.period_end_local
+    lut = None
+    if (period_start or period_end) and fields.minutes_of_day is not None:
+        lut = _time_window_lut(period_start, period_end)
+    if lut is not None:
+        # Whole-minute intervals and bounds: one table lookup per interval
+        np.take(lut, fields.minutes_of_day, out=scratch)
+        rule_mask &= scratch
+    else:
+        if period_start:
+            np.greater_equal(fields.time_of_day_ns, _time_of_day_ns(period_start), out=scratch)
+            rule_mask &= scratch
+        if period_end:
+            np.less(fields.time_of_day_ns, _time_of_day_ns(period_end), out=scratch)
+            rule_mask &= scratch
+
+    # Compare only month/day so that rules match dates regardless of the actual year
+    if rule.start_date:
+        np.greater_equal(fields.month_day_keys, _month_day_key(rule.start_date), out=scratch)
+        rule_mask &= scratch
+    if rule.end_date:
+        np.less_equal(fields.month_day_keys, _month_day_key(rule.end_date), out=scratch)
+        rule_mask &= scratch
 
     return rule_mask
 
@@ -93,10 +235,27 @@ def construct_applicability_mask(
         # No rules means charge applies everywhere
         return pd.Series(True, index=usage.index)
 
-    # Combine all rule masks with OR logic
-    combined_mask = pd.Series(False, index=usage.index)
+    # Packing the day-type flags first also checks that the flag columns exist
+    day_bits = _pack_day_bits(usage)
+
+    # A rule without constraints matches every interval that has a day-type flag set, so
+    # if every interval has one the charge applies everywhere
+    if any(_is_unconstrained(rule) for rule in rules) and day_bits.all():
+        return pd.Series(True, index=usage.index)
+
+    # Rules without any day types can never match
+    rules = tuple(rule for rule in rules if rule.day_types)
+    if not rules:
+        return pd.Series(False, index=usage.index)
+
+    # Derive per-interval fields once and share them across all rules
+    fields = _IntervalFields.from_usage(usage, day_bits)
+
+    # Combine all rule masks with OR logic, reusing the same work buffers for every rule
+    combined_mask = np.zeros(len(usage), dtype=bool)
+    rule_mask = np.empty(len(usage), dtype=bool)
+    scratch = np.empty(len(usage), dtype=bool)
     for rule in rules:
-        rule_mask = _construct_single_rule_mask(usage, rule)
-        combined_mask = combined_mask | rule_mask
+        combined_mask |= _construct_single_rule_mask(fields, rule, rule_mask, scratch)
 
-    return combined_mask
+    return pd.Series(combined_mask, index=usage.index)
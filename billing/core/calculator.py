@@ -18,7 +18,12 @@ from .types import (
     BillLineItem,
     Tariff,
 )
-from .util import _derive_calendar_months, _trim_to_date_range
+from .util import (
+    _date_range_mask,
+    _derive_calendar_months,
+    _local_dates,
+    _trim_to_date_range,
+)
 
 
 def apply_charges(usage: pd.DataFrame, charges: Tariff) -> pd.DataFrame:
@@ -137,9 +142,7 @@ def _calculate_billing_month_result(
     """
 
     # Filter billing_df to only intervals within this billing period
-    mask = (billing_df["interval_start"].dt.date >= period_start) & (
-        billing_df["interval_start"].dt.date <= period_end
-    )
+    mask = _date_range_mask(_local_dates(billing_df["interval_start"]), period_start, period_end)
     period_df = billing_df[mask].copy()
 
     if period_df.empty:
@@ -231,11 +234,10 @@ def calculate_monthly_bills(
 
     # Label with billing months
     usage["billing_period"] = None
+    local_dates = _local_dates(usage["interval_start"])
     for period_start, period_end in billing_periods:
         period_str = f"{period_start:%Y-%m} -- {period_end:%Y-%m}"
-        mask = (usage["interval_start"].dt.date >= period_start) & (
-            usage["interval_start"].dt.date <= period_end
-        )
+        mask = _date_range_mask(local_dates, period_start, period_end)
         usage.loc[mask, "billing_period"] = period_str
 
     # Save original usage columns for filtering out charge columns later
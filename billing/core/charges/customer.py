@@ -5,6 +5,7 @@ Logic for applying customer charges to bills.
 import pandas as pd
 
 from ..types import CustomerCharge, CustomerChargeType
+from ..util import _local_dates
 
 
 def apply_customer_charge(
@@ -28,7 +29,7 @@ def apply_customer_charge(
     """
     if customer_charge.type == CustomerChargeType.DAILY:
         # Group by date and allocate daily charge evenly across intervals
-        usage["_customer_charge_period"] = usage["interval_start"].dt.date
+        usage["_customer_charge_period"] = _local_dates(usage["interval_start"])
     else:
         # Allocate monthly charge evenly across intervals
         usage["_customer_charge_period"] = usage["billing_period"]
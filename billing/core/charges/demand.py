@@ -9,7 +9,7 @@ import pandas as pd
 
 from ..applicability import construct_applicability_mask
 from ..types import ApplicabilityRule, DemandCharge, PeakType
-from ..util import _to_decimal_series
+from ..util import _local_dates, _to_decimal_series
 
 
 def _calculate_applicability_scaling_factor(
@@ -95,7 +95,7 @@ def apply_demand_charge(
         # Monthly refers to billing period rather than calendar month
         usage["_peak_grouping"] = usage["billing_period"]
     elif demand_charge.type == PeakType.DAILY:
-        usage["_peak_grouping"] = usage["interval_start"].dt.date
+        usage["_peak_grouping"] = _local_dates(usage["interval_start"])
     else:
         # DemandCharge validation should prevent this
         raise ValueError(f"Invalid demand_charge.type: {demand_charge.type}")
@@ -7,6 +7,7 @@ from dataclasses import dataclass
 from datetime import timedelta
 from enum import Enum
 
+import numpy as np
 import pandas as pd
 
 
@@ -121,6 +122,22 @@ def analyze_gaps(
     )
 
 
+def _epoch_ns(values: pd.Series) -> np.ndarray:
+    """
+    Get datetimes as int64 nanoseconds since the epoch.
+
+    Tz-aware values are stored as UTC instants, so this is the UTC epoch and needs no tz
+    conversion.
+    """
+    return values.dt.as_unit("ns").array.asi8
+
+
+def _from_epoch_ns(epoch_ns: np.ndarray, tz) -> pd.DatetimeIndex:
+    """Convert int64 epoch nanoseconds back to datetimes, in tz if given."""
+    index = pd.DatetimeIndex(epoch_ns.view("M8[ns]"))
+    return index.tz_localize("UTC").tz_convert(tz) if tz else index
+
+
 class ImputationStrategy(str, Enum):
     """Specify how to fill in missing data."""
 
@@ -156,7 +173,8 @@ def fill_missing_data(
         A new DataFrame with a complete interval grid at the target grain and imputed values.
 
     Raises:
-        ValueError: If duration cannot be inferred, or intervals cannot be split cleanly.
+        ValueError: If duration cannot be inferred, intervals cannot be split cleanly, or
+            interval_start/interval_end contain missing timestamps.
         KeyError: If required columns are missing.
     """
     if usage.empty:
@@ -166,6 +184,9 @@ def fill_missing_data(
     if not required_cols.issubset(usage.columns):
         raise KeyError(f"Missing required columns: {required_cols - set(usage.columns)}")
 
+    if strategy != ImputationStrategy.EXTRAPOLATE_LAST:
+        raise ValueError(f"Unsupported strategy: {strategy}")
+
     df = usage.copy()
 
     # 1. Normalize to UTC for internal calculations
@@ -175,39 +196,49 @@ def fill_missing_data(
     # Capture original timezone from the first valid entry
     tz = df["interval_start"].dt.tz
 
-    # Work in UTC to avoid DST ambiguities during math
-    df["_start_utc"] = df["interval_start"].dt.tz_convert("UTC") if tz else df["interval_start"]
-    df["_end_utc"] = df["interval_end"].dt.tz_convert("UTC") if tz else df["interval_end"]
+    if df["interval_start"].isna().any() or df["interval_end"].isna().any():
+        raise ValueError("interval_start and interval_end must not contain missing timestamps.")
 
-    # Sort and remove duplicates
-    df = df.sort_values("_start_utc").drop_duplicates(subset=["_start_utc"], keep="last")
+    # Work in integer UTC nanoseconds to avoid DST ambiguities (and tz-aware overhead)
+    # during math
+    start_ns = _epoch_ns(df["interval_start"])
+    end_ns = _epoch_ns(df["interval_end"])
+
+    # Sort and remove duplicates, keeping the last row for each start
+    order = np.argsort(start_ns, kind="stable")
+    start_ns = start_ns[order]
+    keep = np.append(start_ns[1:] != start_ns[:-1], True)
+    order = order[keep]
+    df = df.take(order)
+    start_ns = start_ns[keep]
+    end_ns = end_ns[order]
 
     if len(df) <= 1:
         if df.isna().any(axis=None):
             raise ValueError("Cannot fill NaNs in a dataset with only one interval.")
-        return df.drop(columns=["_start_utc", "_end_utc"])
+        return df
 
-    # 2. Infer target grain (mode of start-to-start deltas)
-    target_grain = df["_start_utc"].diff().min()
-    if pd.isna(target_grain) or target_grain <= pd.Timedelta(0):
-        raise ValueError("Could not infer a valid interval duration.")
+    # 2. Infer target grain (smallest start-to-start delta)
+    grain_ns = np.diff(start_ns).min()
+    target_grain = pd.Timedelta(grain_ns, unit="ns")
 
     # 3. Handle Mixed Grain (Splitting longer intervals)
-    durations = df["_end_utc"] - df["_start_utc"]
+    durations = end_ns - start_ns
 
     # Error if intervals cannot be split into the target grain
-    if not (durations % target_grain == pd.Timedelta(0)).all():
+    not_multiple = durations % grain_ns != 0
+    if not_multiple.any():
         # Identify problematic rows for better error messaging
-        invalid = df[durations % target_grain != pd.Timedelta(0)]
+        invalid = df[not_multiple]
         raise ValueError(
             f"Intervals found that aren't multiples of {target_grain}: {invalid['interval_start'].tolist()}"
         )
 
     # Error if intervals overlap (ambiguous what to do)
-    gaps = df["_start_utc"].shift(-1) - df["_end_utc"]
-    if (gaps < pd.Timedelta(0)).any():
-        invalid = df[gaps < pd.Timedelta(0)]
-        after_invalid = df[(gaps < pd.Timedelta(0)).shift(1).fillna(False)]
+    overlaps = np.append(start_ns[1:] < end_ns[:-1], False)
+    if overlaps.any():
+        invalid = df[overlaps]
+        after_invalid = df[np.roll(overlaps, 1)]
         raise ValueError(
             "Intervals found that overlap with subsequent intervals:\n"
             + "\n".join(
@@ -226,7 +257,7 @@ def fill_missing_data(
         )
 
     # Calculate repeat counts
-    repeats = (durations / target_grain).astype(int)
+    repeats = durations // grain_ns
 
     # kWh (Energy) is divided proportionally
     if "kwh" in df.columns:
@@ -234,48 +265,36 @@ def fill_missing_data(
 
     # kW (Demand) remains as-is (independent of interval length)
 
-    # Vectorized expansion of the dataframe
-    df = df.loc[df.index.repeat(repeats)]
-
-    # Correct the energy/demand values and timestamps in the expanded DF
-    group_idx = df.groupby(df.index).cumcount()
-
-    # Update timestamps for sub-intervals
-    df["_start_utc"] = df["_start_utc"] + (group_idx * target_grain)
-    df["_end_utc"] = df["_start_utc"] + target_grain
-
-    # 4. Reindex to a complete time grid
-    full_range = pd.date_range(
-        start=df["_start_utc"].min(),
-        end=df["_end_utc"].max() - target_grain,
-        freq=target_grain,
-        tz="UTC" if tz else None,
-        name="_start_utc",
-    )
-
-    df = df.set_index("_start_utc").reindex(full_range).reset_index()
+    if (repeats == 1).all() and end_ns[-1] - start_ns[0] == len(df) * grain_ns:
+        # Already a complete grid at the target grain: nothing to split or reindex
+        grid_ns = start_ns
+        df = df.reset_index(drop=True)
+    else:
+        # Vectorized expansion of the dataframe: each row is repeated once per
+        # sub-interval, and each copy is offset by its position within the original interval
+        rows = np.repeat(np.arange(len(df)), repeats)
+        first_row = np.repeat(np.cumsum(repeats) - repeats, repeats)
+        sub_start_ns = start_ns[rows] + (np.arange(len(rows)) - first_row) * grain_ns
+
+        # 4. Fill out a complete time grid. Each missing interval repeats the last row
+        # before it; taking rows by position (rather than reindexing and forward-filling)
+        # keeps bool and int columns from being upcast to hold NaN.
+        grid_ns = np.arange(start_ns[0], end_ns[-1] - grain_ns + 1, grain_ns)
+        pos = np.searchsorted(sub_start_ns, grid_ns)
+        present = pos < len(sub_start_ns)
+        present[present] = sub_start_ns[pos[present]] == grid_ns[present]
+        last_present = np.maximum.accumulate(np.where(present, pos, -1))
+        df = df.iloc[rows[last_present]].reset_index(drop=True)
 
     # 5. Finalize columns and Impute
-    if tz:
-        df["interval_start"] = df["_start_utc"].dt.tz_convert(tz)
-        df["interval_end"] = (df["_start_utc"] + target_grain).dt.tz_convert(tz)
-    else:
-        df["interval_start"] = df["_start_utc"]
-        df["interval_end"] = df["_start_utc"] + target_grain
-
-    # Drop internal helper columns
-    df = df.drop(columns=["_end_utc"])
-
-    # Apply Imputation Strategy
-    if strategy == ImputationStrategy.EXTRAPOLATE_LAST:
-        impute_cols = [
-            c for c in df.columns if c not in ("interval_start", "interval_end", "_start_utc")
-        ]
-        df[impute_cols] = df[impute_cols].ffill().infer_objects(copy=False)
-    else:
-        raise ValueError(f"Unsupported strategy: {strategy}")
+    df["interval_start"] = _from_epoch_ns(grid_ns, tz)
+    df["interval_end"] = _from_epoch_ns(grid_ns + grain_ns, tz)
+
+    # Forward-fill NaN values within the data itself
+    impute_cols = [c for c in df.columns if c not in ("interval_start", "interval_end")]
+    df[impute_cols] = df[impute_cols].ffill().infer_objects(copy=False)
 
-    return df.drop(columns=["_start_utc"]).reset_index(drop=True)
+    return df
 
 
 def validate_usage_dataframe(usage: pd.DataFrame) -> None:
@@ -330,28 +349,33 @@ def validate_usage_dataframe(usage: pd.DataFrame) -> None:
         raise ValueError("All rows must satisfy interval_end > interval_start.")
 
     # UTC validation for grain and missing intervals (DST-safe)
-    start_utc = df["interval_start"].dt.tz_convert("UTC")
-    end_utc = df["interval_end"].dt.tz_convert("UTC")
+    start_ns = _epoch_ns(df["interval_start"])
+    end_ns = _epoch_ns(df["interval_end"])
 
-    if start_utc.duplicated().any():
-        dupes = df.loc[start_utc.duplicated(), "interval_start"].head(5).tolist()
+    # Rows are sorted, so a repeated instant always follows its first occurrence
+    duplicated = np.append(False, start_ns[1:] == start_ns[:-1])
+    if duplicated.any():
+        dupes = df.loc[duplicated, "interval_start"].head(5).tolist()
         raise ValueError(
             "Duplicate interval_start instants found (same UTC time). "
             f"Local timestamps (showing up to 5): {dupes}"
         )
 
-    widths_utc = end_utc - start_utc
-    min_w = widths_utc.min()
-    max_w = widths_utc.max()
+    widths_ns = end_ns - start_ns
+    min_w = pd.Timedelta(widths_ns.min(), unit="ns")
+    max_w = pd.Timedelta(widths_ns.max(), unit="ns")
     if min_w != max_w:
         raise ValueError(
             f"Expected consistent interval width in UTC; got min={min_w}, max={max_w}."
         )
 
     expected = max_w
-    start_diffs_utc = start_utc.diff().dropna()
-    if not (start_diffs_utc == expected).all():
-        bad = start_diffs_utc[start_diffs_utc != expected].head(5)
+    start_diffs_ns = np.diff(start_ns)
+    irregular = start_diffs_ns != expected.value
+    if irregular.any():
+        bad = pd.Series(
+            pd.to_timedelta(start_diffs_ns[irregular], unit="ns"), index=df.index[1:][irregular]
+        ).head(5)
         raise ValueError(
             "Usage data has missing or irregular intervals (checked in UTC). "
             f"Expected start-to-start delta {expected}; first mismatches: {bad.to_dict()}."
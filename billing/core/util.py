@@ -3,6 +3,7 @@
 from datetime import date
 from decimal import Decimal
 
+import numpy as np
 import pandas as pd
 
 
@@ -16,6 +17,42 @@ def _to_decimal_series(values: pd.Series) -> pd.Series:
     return values.map(lambda x: Decimal(str(x)))
 
 
+def _local_wall_clock(interval_starts: pd.Series) -> np.ndarray:
+    """
+    Get interval starts as naive datetime64 values in their local wall-clock time.
+
+    Tz-aware values are converted to the wall-clock time of their own timezone; naive
+    values are returned as they are.
+    """
+    if interval_starts.dt.tz is not None:
+        interval_starts = interval_starts.dt.tz_localize(None)
+    return interval_starts.to_numpy()
+
+
+def _local_dates(interval_starts: pd.Series) -> np.ndarray:
+    """
+    Get the local calendar date of each interval start as datetime64[D] values.
+
+    Tz-aware values are truncated in their own wall-clock time, matching what .dt.date
+    returns, but without creating a datetime.date object per row.
+    """
+    return _local_wall_clock(interval_starts).astype("datetime64[D]")
+
+
+def _date_range_mask(local_dates: np.ndarray, start_date: date, end_date: date) -> np.ndarray:
+    """
+    Build a bool mask of local dates falling within a date range.
+
+    Args:
+        local_dates: datetime64[D] values, as returned by _local_dates
+        start_date: Start of date range (inclusive)
+        end_date: End of date range (inclusive)
+    """
+    return (local_dates >= np.datetime64(start_date, "D")) & (
+        local_dates <= np.datetime64(end_date, "D")
+    )
+
+
 def _trim_to_date_range(df: pd.DataFrame, start_date: date, end_date: date) -> pd.DataFrame:
     """
     Filter DataFrame to only include intervals within a date range.
@@ -28,9 +65,7 @@ def _trim_to_date_range(df: pd.DataFrame, start_date: date, end_date: date) -> p
     Returns:
         Filtered DataFrame containing only intervals within the date range
     """
-    mask = (df["interval_start"].dt.date >= start_date) & (
-        df["interval_start"].dt.date <= end_date
-    )
+    mask = _date_range_mask(_local_dates(df["interval_start"]), start_date, end_date)
     return df[mask].copy()
 
 
@@ -12,6 +12,7 @@ from datetime import date, datetime, timedelta
 from typing import TYPE_CHECKING
 import zoneinfo
 
+import numpy as np
 import pandas as pd
 
 from billing.adapters import tariff_to_dto
@@ -23,6 +24,7 @@ from billing.core.data import (
     validate_usage_dataframe,
 )
 from billing.core.types import BillingMonthResult
+from billing.core.util import _local_dates
 from billing.exceptions import InvalidDateRangeError, NoUsageDataError
 from usage.models import CustomerUsage
 from utilities.models import Holiday
@@ -105,13 +107,15 @@ def determine_day_types(
     max_date = df["interval_start"].max().date()
     holiday_dates = get_holiday_dates(utility, min_date, max_date)
 
-    # Calculate day types from local dates
-    local_dates = result["interval_start"].dt.date
-    day_of_week = result["interval_start"].dt.dayofweek
+    # Calculate day types from local dates. Day of week is derived once as an int8
+    # (Monday=0); day 0 of the epoch (1970-01-01) was a Thursday.
+    local_dates = _local_dates(result["interval_start"])
+    day_of_week = ((local_dates.view("int64") + 3) % 7).astype(np.int8)
+    is_holiday = np.isin(local_dates, np.array(sorted(holiday_dates), dtype="datetime64[D]"))
 
-    result["is_holiday"] = local_dates.isin(holiday_dates)
+    result["is_holiday"] = is_holiday
     result["is_weekend"] = day_of_week >= 5  # Sat=5, Sun=6
-    result["is_weekday"] = (day_of_week < 5) & ~result["is_holiday"]
+    result["is_weekday"] = (day_of_week < 5) & ~is_holiday
 
     return result
 
@@ -5,10 +5,12 @@ Unit tests for customer charge logic.
 from datetime import date
 from decimal import Decimal
 
+import numpy as np
 import pytest
 
 from billing.core.charges.customer import apply_customer_charge
 from billing.core.types import CustomerCharge, CustomerChargeType
+from billing.core.util import _date_range_mask, _local_dates
 
 
 @pytest.fixture
@@ -65,10 +67,11 @@ def test_multiple_day_usage_daily(usage_df_factory, daily_customer_charge):
     usage = usage_df_factory(start="2024-01-01 00:00:00", periods=3 * 24, freq="1h")
     customer_charge_series = apply_customer_charge(usage, daily_customer_charge)
 
-    for day in usage["interval_start"].dt.date.unique():
-        intervals_in_day = usage[usage["interval_start"].dt.date == day]
-        charges_in_day = customer_charge_series[usage["interval_start"].dt.date == day]
-        expected_value = daily_customer_charge.amount_usd / len(intervals_in_day)
+    local_dates = _local_dates(usage["interval_start"])
+    for day in np.unique(local_dates):
+        in_day = local_dates == day
+        charges_in_day = customer_charge_series[in_day]
+        expected_value = daily_customer_charge.amount_usd / in_day.sum()
         assert (charges_in_day == expected_value).all()
 
     # Total should equal daily amount * 3 days (use approximate comparison for Decimal precision)
@@ -143,8 +146,8 @@ def test_monthly_charge_non_calendar_multiple_periods(usage_df_factory, monthly_
 
     # Check each billing period separately
     for period_start, period_end in billing_periods:
-        period_mask = (usage["interval_start"].dt.date >= period_start) & (
-            usage["interval_start"].dt.date <= period_end
+        period_mask = _date_range_mask(
+            _local_dates(usage["interval_start"]), period_start, period_end
         )
         intervals_in_period = usage[period_mask]
         charges_in_period = customer_charge_series[period_mask]
@@ -171,10 +174,11 @@ def test_daily_charge_non_calendar_billing_period(usage_df_factory, daily_custom
     customer_charge_series = apply_customer_charge(usage, daily_customer_charge)
 
     # Each day should have charge spread evenly across its intervals
-    for day in usage["interval_start"].dt.date.unique():
-        intervals_in_day = usage[usage["interval_start"].dt.date == day]
-        charges_in_day = customer_charge_series[usage["interval_start"].dt.date == day]
-        expected_value = daily_customer_charge.amount_usd / len(intervals_in_day)
+    local_dates = _local_dates(usage["interval_start"])
+    for day in np.unique(local_dates):
+        in_day = local_dates == day
+        charges_in_day = customer_charge_series[in_day]
+        expected_value = daily_customer_charge.amount_usd / in_day.sum()
         assert (charges_in_day == expected_value).all()
 
     # Total should equal daily amount * 5 days
@@ -200,8 +204,8 @@ def test_monthly_charge_unequal_billing_periods(usage_df_factory, monthly_custom
 
     # Each billing period should have the full monthly charge spread across it
     for period_start, period_end in billing_periods:
-        period_mask = (usage["interval_start"].dt.date >= period_start) & (
-            usage["interval_start"].dt.date <= period_end
+        period_mask = _date_range_mask(
+            _local_dates(usage["interval_start"]), period_start, period_end
         )
         charges_in_period = customer_charge_series[period_mask]
 
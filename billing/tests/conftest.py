@@ -4,17 +4,118 @@ Shared fixtures for billing tests.
 Consolidates DataFrame creation and Django model fixtures used across test files.
 """
 
+import functools
 from datetime import date
 
+import numpy as np
 import pandas as pd
 import pytest
-
-from billing.core.util import _derive_calendar_months, _trim_to_date_range
+from django.db import transaction
+
+from billing.core.util import (
+    _date_range_mask,
+    _derive_calendar_months,
+    _local_dates,
+    _trim_to_date_range,
+)
 from tariffs.models import Tariff
 from utilities.models import Utility
 
+_DAY_TYPE_COLUMNS = ("is_weekday", "is_weekend", "is_holiday")
 
-@pytest.fixture
+
+def _bool_column(value: bool | list | None, periods: int) -> np.ndarray:
+    """Build a day-type flag column as an np.bool_ array (None means False).
+
+    Scalars are broadcast as a read-only zero-stride view; the DataFrame constructor
+    copies dict columns into its own block, so the frame's columns stay writable.
+    """
+    if value is None or isinstance(value, bool):
+        return np.broadcast_to(np.bool_(bool(value)), (periods,))
+    return np.asarray(value, dtype=bool)
+
+
+def _hashable(value):
+    """Lists become tuples so factory arguments can key the template cache."""
+    return tuple(value) if isinstance(value, list) else value
+
+
+@functools.lru_cache(maxsize=8)
+def _usage_df_template(
+    start: str,
+    periods: int,
+    freq: str,
+    tz: str | None,
+    kwh: float | tuple,
+    kw: float | tuple,
+    is_weekday: bool | tuple | None,
+    is_weekend: bool | tuple | None,
+    is_holiday: bool | tuple | None,
+    billing_periods: tuple[tuple[date, date], ...] | None,
+    minimal: bool,
+    unit: str,
+) -> pd.DataFrame:
+    """Build the usage DataFrame for one set of usage_df_factory arguments.
+
+    Keeps the most recently used frames, so repeated arguments within a module skip the
+    rebuild. The result is a template that must never be mutated; the factory hands out
+    copies.
+    """
+    interval_starts = pd.date_range(start=start, periods=periods, freq=freq, tz=tz, unit=unit)
+
+    # Auto-calculate day types from dates if not specified
+    if is_weekday is None and is_weekend is None:
+        # Monday = 0, Sunday = 6; day 0 of the epoch (1970-01-01) was a Thursday
+        local_days = interval_starts.tz_localize(None).to_numpy().astype("datetime64[D]")
+        day_of_week = ((local_days.view("int64") + 3) % 7).astype(np.int8)
+        is_weekday = day_of_week < 5  # Mon-Fri
+        is_weekend = ~is_weekday  # Sat-Sun
+    else:
+        # Use explicit values or default to False
+        is_weekday = _bool_column(is_weekday, periods)
+        is_weekend = _bool_column(is_weekend, periods)
+
+    # Handle is_holiday
+    is_holiday = _bool_column(is_holiday, periods)
+
+    columns = {"interval_start": interval_starts}
+    if not minimal:
+        columns["interval_end"] = interval_starts + pd.Timedelta(freq)
+        columns["kwh"] = kwh
+        columns["kw"] = kw
+    columns["is_weekday"] = is_weekday
+    columns["is_weekend"] = is_weekend
+    columns["is_holiday"] = is_holiday
+    usage = pd.DataFrame(columns)
+
+    # Day-type flags must stay plain numpy bools (not the nullable BooleanDtype), as
+    # they are in production frames
+    for column in _DAY_TYPE_COLUMNS:
+        assert usage[column].dtype == np.bool_, f"{column} is {usage[column].dtype}"
+
+    # add billing periods
+
+    # If billing_periods not provided, derive from calendar months in the data
+    if billing_periods is None:
+        billing_periods = _derive_calendar_months(usage)
+
+    # Trim the data down to just the billing periods
+    billing_start_date = min(period[0] for period in billing_periods)
+    billing_end_date = max(period[1] for period in billing_periods)
+    usage = _trim_to_date_range(usage, billing_start_date, billing_end_date)
+
+    # Label with billing months
+    usage["billing_period"] = None
+    local_dates = _local_dates(usage["interval_start"])
+    for period_start, period_end in billing_periods:
+        period_str = f"{period_start:%Y-%m} -- {period_end:%Y-%m}"
+        mask = _date_range_mask(local_dates, period_start, period_end)
+        usage.loc[mask, "billing_period"] = period_str
+
+    return usage
+
+
+@pytest.fixture(scope="session")
 def usage_df_factory():
     """Factory fixture for creating usage DataFrames with flexible configurations.
 
@@ -34,13 +135,15 @@ def usage_df_factory():
         start: str = "2024-01-01 00:00:00",
         periods: int = 4,
         freq: str = "15min",
-        tz: str = "US/Pacific",
+        tz: str | None = "US/Pacific",
         kwh: float = 10.5,
         kw: float = 42.0,
         is_weekday: bool | list | None = None,
         is_weekend: bool | list | None = None,
         is_holiday: bool | list | None = None,
         billing_periods: list[tuple[date, date]] | None = None,
+        minimal: bool = False,
+        unit: str = "ns",
     ) -> pd.DataFrame:
         """Create usage DataFrame with configurable parameters.
 
@@ -48,7 +151,8 @@ def usage_df_factory():
             start: ISO format start datetime string
             periods: Number of intervals to create
             freq: Pandas frequency string (e.g., "15min", "1h")
-            tz: Timezone name (e.g., "US/Pacific")
+            tz: Timezone name (e.g., "US/Pacific"), or None for naive local wall-clock
+                times (skips tz conversion for tests that only need local time)
             kwh: Energy usage value (scalar or will be repeated)
             kw: Demand value (scalar or will be repeated)
             is_weekday: If None, auto-detect from date. If bool, use for all periods.
@@ -60,97 +164,71 @@ def usage_df_factory():
             billing_periods: Optional list of (start_date, end_date) tuples defining
                 billing periods. Both dates are inclusive. If None, uses calendar months
                 derived from the usage data.
+            minimal: If True, omit the interval_end, kwh and kw columns. Useful for tests
+                that only exercise applicability masks, which read just interval_start and
+                the day type flags.
+            unit: Resolution of the interval timestamps. Defaults to "ns", which is what
+                load_usage_dataframe produces.
 
         Returns:
             DataFrame with columns: interval_start, interval_end, kwh, kw,
                                    is_weekday, is_weekend, is_holiday
+            (interval_end, kwh and kw are omitted when minimal is True)
+
+            Each call returns a fresh copy of a cached template, so callers may mutate it.
         """
-        interval_starts = pd.date_range(start=start, periods=periods, freq=freq, tz=tz)
-
-        # Auto-calculate day types from dates if not specified
-        if is_weekday is None and is_weekend is None:
-            # Monday = 0, Sunday = 6
-            day_of_week = interval_starts.dayofweek
-            is_weekday = (day_of_week >= 0) & (day_of_week <= 4)  # Mon-Fri
-            is_weekend = (day_of_week >= 5) & (day_of_week <= 6)  # Sat-Sun
-        else:
-            # Use explicit values or default to False
-            if is_weekday is None:
-                is_weekday = [False] * periods
-            elif isinstance(is_weekday, bool):
-                is_weekday = [is_weekday] * periods
-
-            if is_weekend is None:
-                is_weekend = [False] * periods
-            elif isinstance(is_weekend, bool):
-                is_weekend = [is_weekend] * periods
-
-        # Handle is_holiday
-        if is_holiday is None:
-            is_holiday = [False] * periods
-        elif isinstance(is_holiday, bool):
-            is_holiday = [is_holiday] * periods
-
-        usage = pd.DataFrame(
-            {
-                "interval_start": interval_starts,
-                "interval_end": interval_starts + pd.Timedelta(freq),
-                "kwh": kwh,
-                "kw": kw,
-                "is_weekday": is_weekday,
-                "is_weekend": is_weekend,
-                "is_holiday": is_holiday,
-            }
-        )
-
-        # add billing periods
-
-        # If billing_periods not provided, derive from calendar months in the data
-        if billing_periods is None:
-            billing_periods = _derive_calendar_months(usage)
-
-        # Trim the data down to just the billing periods
-        billing_start_date = min(period[0] for period in billing_periods)
-        billing_end_date = max(period[1] for period in billing_periods)
-        usage = _trim_to_date_range(usage, billing_start_date, billing_end_date)
-
-        # Label with billing months
-        usage["billing_period"] = None
-        for period_start, period_end in billing_periods:
-            period_str = f"{period_start:%Y-%m} -- {period_end:%Y-%m}"
-            mask = (usage["interval_start"].dt.date >= period_start) & (
-                usage["interval_start"].dt.date <= period_end
-            )
-            usage.loc[mask, "billing_period"] = period_str
-
-        return usage
+        return _usage_df_template(
+            start,
+            periods,
+            freq,
+            tz,
+            _hashable(kwh),
+            _hashable(kw),
+            _hashable(is_weekday),
+            _hashable(is_weekend),
+            _hashable(is_holiday),
+            _hashable(billing_periods),
+            minimal,
+            unit,
+        ).copy()
 
     return _create_usage_df
 
 
-@pytest.fixture
-def utility(db):
-    """Create a test utility.
+@pytest.fixture(scope="module")
+def shared_tariff(django_db_setup, django_db_blocker):
+    """Create a test utility and tariff once per test module.
 
-    Replaces setUp() methods in test_adapters.py test classes.
+    The rows live outside the per-test transaction, so each test's own inserts are
+    still rolled back while these are reused. Both inserts share a single commit.
+    Deleting the utility cascades to the tariff.
     """
-    return Utility.objects.create(name="Test Utility")
+    with django_db_blocker.unblock(), transaction.atomic():
+        utility = Utility.objects.create(name="Test Utility")
+        tariff = Tariff.objects.create(utility=utility, name="Test Tariff")
+    yield tariff
+    with django_db_blocker.unblock():
+        utility.delete()
 
 
 @pytest.fixture
-def tariff(utility):
-    """Create a test tariff with utility dependency.
-
-    Replaces setUp() methods in test_adapters.py test classes.
-    """
-    return Tariff.objects.create(utility=utility, name="Test Tariff")
+def utility(db, shared_tariff):
+    """Shared test utility (created once per module)."""
+    return shared_tariff.utility
 
 
 @pytest.fixture
+def tariff(db, shared_tariff):
+    """Shared test tariff with utility dependency (created once per module)."""
+    return shared_tariff
+
+
+@pytest.fixture(scope="module")
 def hourly_day_usage(usage_df_factory):
     """24 hours of hourly data for a single day (January 1, 2024).
 
-    Commonly used for time-of-day filtering tests.
+    Commonly used for time-of-day filtering tests. Built once per module; tests that
+    need to change a column should work on a copy (e.g. ``usage.assign(...)``).
     """
     return usage_df_factory(
         start="2024-01-01 00:00:00",
@@ -161,12 +239,12 @@ def hourly_day_usage(usage_df_factory):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def full_week_usage(usage_df_factory):
     """Full week of hourly intervals (Mon-Sun starting Monday, January 1, 2024).
 
     Day types auto-detected from dates.
-    Commonly used for day type filtering tests.
+    Commonly used for day type filtering tests. Built once per module.
     """
     return usage_df_factory(
         start="2024-01-01 00:00:00",  # Monday
@@ -175,11 +253,11 @@ def full_week_usage(usage_df_factory):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def month_usage(usage_df_factory):
     """Full month of hourly data (January 2024 - 31 days).
 
-    Commonly used for date range filtering tests.
+    Commonly used for date range filtering tests. Built once per module.
     """
     return usage_df_factory(
         start="2024-01-01 00:00:00",
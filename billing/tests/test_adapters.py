@@ -8,6 +8,7 @@ from datetime import date, time
 from decimal import Decimal
 
 import pytest
+from django.db import transaction
 
 from billing.adapters import (
     applicability_rule_to_dto,
@@ -28,6 +29,86 @@ from tariffs.models import (
     Tariff,
 )
 
+# Canonical Decimal amounts, parsed once at import and reused by fixtures and assertions
+_D = {
+    amount: Decimal(amount)
+    for amount in (
+        "0.08",
+        "0.10",
+        "0.15",
+        "0.20",
+        "0.25",
+        "0.30",
+        "1.50",
+        "10.00",
+        "12.00",
+        "15.00",
+        "20.00",
+        "25.00",
+    )
+}
+
+# Related charges to prefetch when loading a tariff for conversion
+_CHARGE_RELATIONS = (
+    "energy_charges__applicability_rules",
+    "demand_charges__applicability_rules",
+    "customer_charges",
+)
+
+
+def _load_tariff(pk: int) -> Tariff:
+    """Load a tariff with all charges and applicability rules prefetched."""
+    return Tariff.objects.prefetch_related(*_CHARGE_RELATIONS).get(pk=pk)
+
+
+# Unsaved model factories defaulting to the common "always applies" shape
+
+_T0000 = time(0, 0)
+_T2359 = time(23, 59)
+
+
+def _make_rule(
+    name: str,
+    start: time | None = _T0000,
+    end: time | None = _T2359,
+    weekdays: bool = True,
+    weekends: bool = True,
+    holidays: bool = True,
+    start_date: date | None = None,
+    end_date: date | None = None,
+) -> ApplicabilityRule:
+    """Build an unsaved ApplicabilityRule; only deviations from all-day need passing."""
+    return ApplicabilityRule(
+        name=name,
+        period_start_time_local=start,
+        period_end_time_local=end,
+        applies_start_date=start_date,
+        applies_end_date=end_date,
+        applies_weekdays=weekdays,
+        applies_weekends=weekends,
+        applies_holidays=holidays,
+    )
+
+
+def _make_energy(tariff: Tariff, name: str, rate: Decimal) -> EnergyCharge:
+    """Build an unsaved EnergyCharge."""
+    return EnergyCharge(tariff=tariff, name=name, rate_usd_per_kwh=rate)
+
+
+def _make_demand(
+    tariff: Tariff, name: str, rate: Decimal, peak_type: str = "monthly"
+) -> DemandCharge:
+    """Build an unsaved DemandCharge."""
+    return DemandCharge(tariff=tariff, name=name, rate_usd_per_kw=rate, peak_type=peak_type)
+
+
+def _make_customer(
+    tariff: Tariff, name: str, amount: Decimal, charge_type: str = "monthly"
+) -> CustomerCharge:
+    """Build an unsaved CustomerCharge."""
+    return CustomerCharge(tariff=tariff, name=name, amount_usd=amount, charge_type=charge_type)
+
+
 # ChargeId Generation Tests
 
 
@@ -75,20 +156,19 @@ def test_build_day_types(weekdays, weekends, holidays, expected):
 
 
 # ApplicabilityRule Construction Tests
+# The rule adapter only reads attributes, so these use unsaved instances and need no DB.
 
 
-@pytest.mark.django_db
 def test_full_applicability_rule():
     """Test converting ApplicabilityRule model with all fields to DTO."""
-    orm_rule = ApplicabilityRule.objects.create(
-        name="Summer Peak Hours",
-        period_start_time_local=time(8, 0),
-        period_end_time_local=time(17, 0),
-        applies_start_date=date(2024, 6, 1),
-        applies_end_date=date(2024, 8, 31),
-        applies_weekdays=True,
-        applies_weekends=False,
-        applies_holidays=False,
+    orm_rule = _make_rule(
+        "Summer Peak Hours",
+        time(8, 0),
+        time(17, 0),
+        weekends=False,
+        holidays=False,
+        start_date=date(2024, 6, 1),
+        end_date=date(2024, 8, 31),
     )
 
     rule = applicability_rule_to_dto(orm_rule)
@@ -100,19 +180,9 @@ def test_full_applicability_rule():
     assert rule.day_types == frozenset({DayType.WEEKDAY})
 
 
-@pytest.mark.django_db
 def test_applicability_rule_with_nulls():
     """Test ApplicabilityRule DTO with None dates (year-round)."""
-    orm_rule = ApplicabilityRule.objects.create(
-        name="Year-Round All Days",
-        period_start_time_local=time(0, 0),
-        period_end_time_local=time(23, 59),
-        applies_start_date=None,
-        applies_end_date=None,
-        applies_weekdays=True,
-        applies_weekends=True,
-        applies_holidays=True,
-    )
+    orm_rule = _make_rule("Year-Round All Days")
 
     rule = applicability_rule_to_dto(orm_rule)
 
@@ -127,26 +197,20 @@ def test_applicability_rule_with_nulls():
 def test_energy_charge_conversion(tariff):
     """Test converting EnergyCharge model to DTO."""
     # Create applicability rule first
-    rule = ApplicabilityRule.objects.create(
-        name="Peak Hours",
-        period_start_time_local=time(12, 0),
-        period_end_time_local=time(18, 0),
-        applies_weekdays=True,
-        applies_weekends=False,
-        applies_holidays=False,
-    )
+    rule = _make_rule("Peak Hours", time(12, 0), time(18, 0), weekends=False, holidays=False)
+    rule.save()
 
     charge = EnergyCharge.objects.create(
         tariff=tariff,
         name="Peak Energy",
-        rate_usd_per_kwh=Decimal("0.25"),
+        rate_usd_per_kwh=_D["0.25"],
     )
     charge.applicability_rules.add(rule)
 
     dto = energy_charge_to_dto(charge)
 
     assert dto.name == "Peak Energy"
-    assert dto.rate_usd_per_kwh == Decimal("0.25")
+    assert dto.rate_usd_per_kwh == _D["0.25"]
     assert len(dto.applicability_rules) == 1
     assert dto.applicability_rules[0].period_start_local == time(12, 0)
     assert dto.applicability_rules[0].period_end_local == time(18, 0)
@@ -155,27 +219,17 @@ def test_energy_charge_conversion(tariff):
 
 def test_energy_charge_with_multiple_rules(tariff):
     """Test converting EnergyCharge with multiple applicability rules."""
-    rule1 = ApplicabilityRule.objects.create(
-        name="Morning Peak",
-        period_start_time_local=time(8, 0),
-        period_end_time_local=time(12, 0),
-        applies_weekdays=True,
-        applies_weekends=False,
-        applies_holidays=False,
-    )
-    rule2 = ApplicabilityRule.objects.create(
-        name="Evening Peak",
-        period_start_time_local=time(17, 0),
-        period_end_time_local=time(21, 0),
-        applies_weekdays=True,
-        applies_weekends=False,
-        applies_holidays=False,
+    rule1, rule2 = ApplicabilityRule.objects.bulk_create(
+        [
+            _make_rule("Morning Peak", time(8, 0), time(12, 0), weekends=False, holidays=False),
+            _make_rule("Evening Peak", time(17, 0), time(21, 0), weekends=False, holidays=False),
+        ]
     )
 
     charge = EnergyCharge.objects.create(
         tariff=tariff,
         name="Peak Energy",
-        rate_usd_per_kwh=Decimal("0.30"),
+        rate_usd_per_kwh=_D["0.30"],
     )
     charge.applicability_rules.add(rule1, rule2)
 
@@ -190,7 +244,7 @@ def test_energy_charge_with_no_rules(tariff):
     charge = EnergyCharge.objects.create(
         tariff=tariff,
         name="Base Energy",
-        rate_usd_per_kwh=Decimal("0.08"),
+        rate_usd_per_kwh=_D["0.08"],
     )
     # No rules added
 
@@ -202,19 +256,13 @@ def test_energy_charge_with_no_rules(tariff):
 
 def test_energy_charge_id_stability(tariff):
     """ChargeId should be stable across multiple conversions."""
-    rule = ApplicabilityRule.objects.create(
-        name="All Hours",
-        period_start_time_local=time(0, 0),
-        period_end_time_local=time(23, 59),
-        applies_weekdays=True,
-        applies_weekends=True,
-        applies_holidays=True,
-    )
+    rule = _make_rule("All Hours")
+    rule.save()
 
     charge = EnergyCharge.objects.create(
         tariff=tariff,
         name="Off Peak",
-        rate_usd_per_kwh=Decimal("0.10"),
+        rate_usd_per_kwh=_D["0.10"],
     )
     charge.applicability_rules.add(rule)
 
@@ -236,19 +284,13 @@ def test_energy_charge_id_stability(tariff):
 )
 def test_demand_charge_conversion(tariff, peak_type, expected_enum):
     """Test converting DemandCharge to DTO for different peak types."""
-    rule = ApplicabilityRule.objects.create(
-        name="All Hours",
-        period_start_time_local=time(0, 0),
-        period_end_time_local=time(23, 59),
-        applies_weekdays=True,
-        applies_weekends=True,
-        applies_holidays=True,
-    )
+    rule = _make_rule("All Hours")
+    rule.save()
 
     charge = DemandCharge.objects.create(
         tariff=tariff,
         name=f"{peak_type.title()} Demand",
-        rate_usd_per_kw=Decimal("15.00"),
+        rate_usd_per_kw=_D["15.00"],
         peak_type=peak_type,
     )
     charge.applicability_rules.add(rule)
@@ -256,7 +298,7 @@ def test_demand_charge_conversion(tariff, peak_type, expected_enum):
     dto = demand_charge_to_dto(charge)
 
     assert dto.name == f"{peak_type.title()} Demand"
-    assert dto.rate_usd_per_kw == Decimal("15.00")
+    assert dto.rate_usd_per_kw == _D["15.00"]
     assert dto.type == expected_enum
     assert len(dto.applicability_rules) == 1
 
@@ -266,7 +308,7 @@ def test_demand_charge_invalid_peak_type_raises_error(tariff):
     charge = DemandCharge.objects.create(
         tariff=tariff,
         name="Invalid Demand",
-        rate_usd_per_kw=Decimal("10.00"),
+        rate_usd_per_kw=_D["10.00"],
         peak_type="monthly",  # Valid for creation
     )
 
@@ -285,13 +327,13 @@ def test_demand_charge_invalid_peak_type_raises_error(tariff):
 def test_customer_charge_conversion(tariff):
     """Test converting CustomerCharge model to DTO."""
     charge = CustomerCharge.objects.create(
-        tariff=tariff, name="Monthly Service Fee", amount_usd=Decimal("25.00")
+        tariff=tariff, name="Monthly Service Fee", amount_usd=_D["25.00"]
     )
 
     dto = customer_charge_to_dto(charge)
 
     assert dto.name == "Monthly Service Fee"
-    assert dto.amount_usd == Decimal("25.00")
+    assert dto.amount_usd == _D["25.00"]
     assert dto.type.value == "monthly"  # Default charge type
     assert dto.charge_id is not None
 
@@ -301,14 +343,14 @@ def test_customer_charge_daily_conversion(tariff):
     charge = CustomerCharge.objects.create(
         tariff=tariff,
         name="Daily Service Fee",
-        amount_usd=Decimal("1.50"),
+        amount_usd=_D["1.50"],
         charge_type="daily",
     )
 
     dto = customer_charge_to_dto(charge)
 
     assert dto.name == "Daily Service Fee"
-    assert dto.amount_usd == Decimal("1.50")
+    assert dto.amount_usd == _D["1.50"]
     assert dto.type.value == "daily"
     assert dto.charge_id is not None
 
@@ -316,72 +358,56 @@ def test_customer_charge_daily_conversion(tariff):
 # Full Tariff Conversion Tests
 
 
-def test_tariff_to_dto_counts(utility):
-    """Test converting full tariff produces correct charge counts."""
-    tariff = Tariff.objects.create(utility=utility, name="Complete Tariff")
+@pytest.fixture(scope="module")
+def prefetched_tariff(shared_tariff, django_db_blocker):
+    """Tariff with several charges of each type, loaded and prefetched once per module.
 
-    # Create multiple charges of each type
-    EnergyCharge.objects.create(
-        tariff=tariff,
-        name="Off Peak",
-        rate_usd_per_kwh=Decimal("0.10"),
-    )
-    EnergyCharge.objects.create(
-        tariff=tariff,
-        name="On Peak",
-        rate_usd_per_kwh=Decimal("0.20"),
-    )
+    Attached to the shared utility so the module teardown cascades to it. Tests must
+    treat the returned instance as read-only.
+    """
+    with django_db_blocker.unblock(), transaction.atomic():
+        tariff = Tariff.objects.create(utility=shared_tariff.utility, name="Complete Tariff")
 
-    DemandCharge.objects.create(
-        tariff=tariff,
-        name="Demand",
-        rate_usd_per_kw=Decimal("10.00"),
-        peak_type="monthly",
-    )
+        # Create multiple charges of each type
+        EnergyCharge.objects.bulk_create(
+            [
+                _make_energy(tariff, "Off Peak", _D["0.10"]),
+                _make_energy(tariff, "On Peak", _D["0.20"]),
+            ]
+        )
+        _make_demand(tariff, "Demand", _D["10.00"]).save()
+        _make_customer(tariff, "Service Fee", _D["20.00"]).save()
 
-    CustomerCharge.objects.create(tariff=tariff, name="Service Fee", amount_usd=Decimal("20.00"))
+        return _load_tariff(tariff.pk)
 
-    tariff = Tariff.objects.prefetch_related(
-        "energy_charges__applicability_rules",
-        "demand_charges__applicability_rules",
-        "customer_charges",
-    ).get(pk=tariff.pk)
 
-    tariff_dto = tariff_to_dto(tariff)
+def test_tariff_to_dto_counts(prefetched_tariff):
+    """Test converting full tariff produces correct charge counts."""
+    tariff_dto = tariff_to_dto(prefetched_tariff)
 
     assert len(tariff_dto.energy_charges) == 2
     assert len(tariff_dto.demand_charges) == 1
     assert len(tariff_dto.customer_charges) == 1
 
 
-def test_tariff_to_dto_immutability(utility):
+def test_tariff_to_dto_immutability(prefetched_tariff):
     """Test that Tariff uses tuples (immutable)."""
-    tariff = Tariff.objects.create(utility=utility, name="Test Tariff")
-
-    EnergyCharge.objects.create(
-        tariff=tariff,
-        name="Test Charge",
-        rate_usd_per_kwh=Decimal("0.15"),
-    )
-
-    tariff = Tariff.objects.prefetch_related(
-        "energy_charges__applicability_rules",
-        "demand_charges__applicability_rules",
-        "customer_charges",
-    ).get(pk=tariff.pk)
-
-    tariff_dto = tariff_to_dto(tariff)
+    tariff_dto = tariff_to_dto(prefetched_tariff)
 
     assert isinstance(tariff_dto.energy_charges, tuple)
     assert isinstance(tariff_dto.demand_charges, tuple)
     assert isinstance(tariff_dto.customer_charges, tuple)
 
 
-def test_empty_tariff_conversion(utility):
-    """Test converting tariff with no charges."""
+def test_empty_tariff_conversion(utility, django_assert_num_queries):
+    """Test converting an unprefetched tariff with no charges.
+
+    Without prefetching, each of the three related managers costs one query.
+    """
     empty_tariff = Tariff.objects.create(utility=utility, name="Empty Tariff")
 
-    tariff_dto = tariff_to_dto(empty_tariff)
+    with django_assert_num_queries(3):
+        tariff_dto = tariff_to_dto(empty_tariff)
 
     assert len(tariff_dto.energy_charges) == 0
     assert len(tariff_dto.demand_charges) == 0
@@ -391,24 +417,24 @@ def test_empty_tariff_conversion(utility):
 # Batch Tariff Conversion Tests
 
 
-def test_batch_conversion(utility):
+def test_batch_conversion(utility, tariff):
     """Test batch converting multiple tariffs."""
-    tariff1 = Tariff.objects.create(utility=utility, name="Tariff 1")
+    tariff1 = tariff
     EnergyCharge.objects.create(
         tariff=tariff1,
         name="Energy 1",
-        rate_usd_per_kwh=Decimal("0.15"),
+        rate_usd_per_kwh=_D["0.15"],
     )
 
     tariff2 = Tariff.objects.create(utility=utility, name="Tariff 2")
     DemandCharge.objects.create(
         tariff=tariff2,
         name="Demand 2",
-        rate_usd_per_kw=Decimal("12.00"),
+        rate_usd_per_kw=_D["12.00"],
         peak_type="monthly",
     )
 
-    queryset = Tariff.objects.all()
+    queryset = Tariff.objects.filter(pk__in=[tariff1.pk, tariff2.pk])
     tariff_dtos = tariffs_to_dtos(queryset)
 
     assert len(tariff_dtos) == 2
@@ -420,9 +446,8 @@ def test_batch_conversion(utility):
     assert len(tariff_dtos[tariff2.pk].demand_charges) == 1
 
 
-def test_batch_conversion_returns_dict(utility):
+def test_batch_conversion_returns_dict(utility, tariff):
     """Test batch conversion returns dictionary keyed by tariff PK."""
-    Tariff.objects.create(utility=utility, name="Tariff 1")
     Tariff.objects.create(utility=utility, name="Tariff 2")
 
     queryset = Tariff.objects.all()
@@ -7,153 +7,200 @@ Tests apply_charges() and calculate_monthly_bills() functions.
 from datetime import date
 from decimal import Decimal
 
+import pandas as pd
 import pytest
 
 from billing.core.calculator import apply_charges, calculate_monthly_bills
-from billing.core.types import CustomerCharge, DemandCharge, EnergyCharge, PeakType, Tariff
+from billing.core.types import (
+    BillingMonthResult,
+    CustomerCharge,
+    DemandCharge,
+    EnergyCharge,
+    PeakType,
+    Tariff,
+)
+from billing.core.util import _date_range_mask, _local_dates
 
-# Fixtures for test charges
+_ENERGY_RATE = Decimal("0.10")
+_DEMAND_RATE = Decimal("15.00")
+_CUSTOMER_AMOUNT = Decimal("25.00")
 
+# Fixtures for test charges (charge dataclasses are frozen, so one instance per session is
+# shared by every test)
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def simple_energy_charge():
     """Basic energy charge: $0.10/kWh."""
     return EnergyCharge(
         name="Test Energy",
-        rate_usd_per_kwh=Decimal("0.10"),
+        rate_usd_per_kwh=_ENERGY_RATE,
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def simple_demand_charge():
     """Basic monthly demand charge: $15/kW."""
     return DemandCharge(
         name="Test Demand",
-        rate_usd_per_kw=Decimal("15.00"),
+        rate_usd_per_kw=_DEMAND_RATE,
         type=PeakType.MONTHLY,
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def simple_customer_charge():
     """Basic customer charge: $25/month."""
     return CustomerCharge(
         name="Test Customer",
-        amount_usd=Decimal("25.00"),
+        amount_usd=_CUSTOMER_AMOUNT,
     )
 
 
-# Tests for apply_charges()
-
-
-def test_apply_charges_empty_charges(hourly_day_usage):
-    """
-    Empty Tariff returns usage DataFrame unchanged.
-
-    Expected: No charge columns added, only original usage columns
-    """
-    empty_charges = Tariff(
-        energy_charges=tuple(),
+@pytest.fixture(scope="session")
+def energy_only_tariff(simple_energy_charge):
+    """Tariff with just simple_energy_charge."""
+    return Tariff(
+        energy_charges=(simple_energy_charge,),
         demand_charges=tuple(),
         customer_charges=tuple(),
     )
 
-    result = apply_charges(hourly_day_usage, empty_charges)
 
-    # Should have only the original usage columns
-    assert len(result.columns) == hourly_day_usage.shape[1]
-    assert set(result.columns) == set(hourly_day_usage.columns)
+# Several tests inspect the same calculation (energy_only_tariff over hourly_day_usage), so
+# it is run once per module. The results are shared and must be treated as read-only.
 
 
-def test_apply_charges_single_energy_charge(hourly_day_usage, simple_energy_charge):
-    """
-    Single energy charge adds one column with correct values.
+@pytest.fixture(scope="module")
+def energy_only_billing_df(hourly_day_usage, energy_only_tariff):
+    """apply_charges() output for energy_only_tariff over hourly_day_usage."""
+    return apply_charges(hourly_day_usage, energy_only_tariff)
 
-    Expected: Original 7 columns + 1 charge column with energy charge values
-    """
-    charges = Tariff(
-        energy_charges=(simple_energy_charge,),
-        demand_charges=tuple(),
-        customer_charges=tuple(),
-    )
 
-    result = apply_charges(hourly_day_usage, charges)
+@pytest.fixture(scope="module")
+def energy_only_monthly_bills(hourly_day_usage, energy_only_tariff):
+    """calculate_monthly_bills() output for energy_only_tariff over hourly_day_usage."""
+    return calculate_monthly_bills(hourly_day_usage, energy_only_tariff)
 
-    # Should have 8 columns (7 usage + 1 charge)
-    assert len(result.columns) == hourly_day_usage.shape[1] + 1
 
-    # Find the charge column
-    charge_columns = [col for col in result.columns if col not in hourly_day_usage.columns]
-    assert len(charge_columns) == 1
+@pytest.fixture(scope="module")
+def two_month_usage(usage_df_factory):
+    """Hourly usage for Jan-Feb 2024 (60 days), shared read-only by the billing_months tests."""
+    return usage_df_factory(start="2024-01-01 00:00:00", periods=60 * 24, freq="1h")
 
-    # Verify charge column is labeled with charge_id UUID
-    charge_col = charge_columns[0]
-    assert charge_col == str(simple_energy_charge.charge_id.value)
 
-    # Verify values are correct (rate × kwh for each interval)
-    expected_charge = simple_energy_charge.rate_usd_per_kwh * Decimal(
-        str(hourly_day_usage["kwh"].iloc[0])
-    )
-    assert (result[charge_col] == expected_charge).all()
+@pytest.fixture(scope="module")
+def three_month_daily_usage(usage_df_factory):
+    """Daily usage for Jan-Mar 2024 (90 days); period splitting only needs daily rows."""
+    return usage_df_factory(start="2024-01-01 00:00:00", periods=90, freq="1D")
 
 
-def test_apply_charges_single_demand_charge(hourly_day_usage, simple_demand_charge):
-    """
-    Single demand charge adds one column.
+@pytest.fixture(scope="module")
+def jan15_feb14_bills(
+    two_month_usage, simple_energy_charge, simple_demand_charge, simple_customer_charge
+):
+    """calculate_monthly_bills() output for one Jan 15 - Feb 14 billing month.
 
-    Expected: Demand charge applied correctly with peak identification
+    The tariff has one charge of each type. Each charge gets its own column and line item,
+    so the billing_months tests can each check their charge type against one shared run.
     """
     charges = Tariff(
-        energy_charges=tuple(),
-        demand_charges=(simple_demand_charge,),
-        customer_charges=tuple(),
+        energy_charges=(simple_energy_charge,),  # $0.10/kWh
+        demand_charges=(simple_demand_charge,),  # $15/kW
+        customer_charges=(simple_customer_charge,),  # $25/month
     )
 
-    result = apply_charges(hourly_day_usage, charges)
+    # Billing month is Jan 15 - Feb 14 (31 days: 17 in Jan, 14 in Feb)
+    billing_months = [(date(2024, 1, 15), date(2024, 2, 14))]
+    return calculate_monthly_bills(two_month_usage, charges, billing_months)
 
-    # Should have 8 columns (7 usage + 1 charge)
-    assert len(result.columns) == hourly_day_usage.shape[1] + 1
 
-    # Find charge column
-    charge_columns = [col for col in result.columns if col not in hourly_day_usage.columns]
-    assert len(charge_columns) == 1
+# Tests for apply_charges()
 
-    charge_col = charge_columns[0]
-    assert charge_col == str(simple_demand_charge.charge_id.value)
 
-    # Demand charge should sum to rate × peak_kw
-    peak_kw = hourly_day_usage["kw"].max()
-    expected_total = simple_demand_charge.rate_usd_per_kw * Decimal(str(peak_kw))
-    actual_total = result[charge_col].sum()
-    assert actual_total == expected_total
+def test_apply_charges_empty_charges(hourly_day_usage):
+    """
+    Empty Tariff returns usage DataFrame unchanged.
 
+    Expected: No charge columns added, only original usage columns
+    """
+    empty_charges = Tariff(
+        energy_charges=tuple(),
+        demand_charges=tuple(),
+        customer_charges=tuple(),
+    )
 
-def test_apply_charges_single_customer_charge(hourly_day_usage, simple_customer_charge):
+    result = apply_charges(hourly_day_usage, empty_charges)
+
+    # Should have only the original usage columns
+    assert len(result.columns) == hourly_day_usage.shape[1]
+    assert set(result.columns) == set(hourly_day_usage.columns)
+
+
+def _check_energy_values(usage, charge, charge_values):
+    """Energy charge is rate × kwh for each interval."""
+    expected_charge = charge.rate_usd_per_kwh * Decimal(str(usage["kwh"].iloc[0]))
+    assert charge_values.tolist() == [expected_charge] * len(usage)
+
+
+def _check_demand_total(usage, charge, charge_values):
+    """Demand charge sums to rate × peak_kw (with peak identification)."""
+    peak_kw = usage["kw"].max()
+    total = charge_values.sum()
+    assert total == charge.rate_usd_per_kw * Decimal(str(peak_kw))
+
+
+def _check_customer_charge_distributed(usage, charge, charge_values):
+    """Customer charge is distributed across intervals (prorated for usage duration)."""
+    total = charge_values.sum()
+    assert total > 0
+
+
+@pytest.mark.parametrize(
+    "charge_fixture,tariff_field,check_values",
+    [
+        pytest.param("simple_energy_charge", "energy_charges", _check_energy_values, id="energy"),
+        pytest.param("simple_demand_charge", "demand_charges", _check_demand_total, id="demand"),
+        pytest.param(
+            "simple_customer_charge",
+            "customer_charges",
+            _check_customer_charge_distributed,
+            id="customer",
+        ),
+    ],
+)
+def test_apply_charges_single_charge(
+    request, hourly_day_usage, charge_fixture, tariff_field, check_values
+):
     """
-    Single customer charge adds one column.
+    A single charge of each type adds one column with correct values.
 
-    Expected: Customer charge distributed across intervals
+    Expected: Original 7 columns + 1 charge column labeled with the charge's UUID
     """
+    charge = request.getfixturevalue(charge_fixture)
     charges = Tariff(
-        energy_charges=tuple(),
-        demand_charges=tuple(),
-        customer_charges=(simple_customer_charge,),
+        **{
+            "energy_charges": tuple(),
+            "demand_charges": tuple(),
+            "customer_charges": tuple(),
+            tariff_field: (charge,),
+        }
     )
 
     result = apply_charges(hourly_day_usage, charges)
 
-    # Should have 8 columns
+    # Should have 8 columns (7 usage + 1 charge)
     assert len(result.columns) == hourly_day_usage.shape[1] + 1
 
-    # Find charge column
-    charge_columns = [col for col in result.columns if col not in hourly_day_usage.columns]
+    # Find the charge column
+    charge_columns = result.columns.difference(hourly_day_usage.columns)
     assert len(charge_columns) == 1
 
+    # Verify charge column is labeled with charge_id UUID
     charge_col = charge_columns[0]
-    assert charge_col == str(simple_customer_charge.charge_id.value)
+    assert charge_col == str(charge.charge_id.value)
 
-    # Customer charge should sum to monthly amount (prorated for usage duration)
-    assert result[charge_col].sum() > 0
+    check_values(hourly_day_usage, charge, result[charge_col])
 
 
 def test_apply_charges_multiple_charges(
@@ -176,7 +223,7 @@ def test_apply_charges_multiple_charges(
     assert len(result.columns) == hourly_day_usage.shape[1] + 3
 
     # Find charge columns
-    charge_columns = [col for col in result.columns if col not in hourly_day_usage.columns]
+    charge_columns = result.columns.difference(hourly_day_usage.columns)
     assert len(charge_columns) == 3
 
     # Verify all charge_ids are present
@@ -188,41 +235,51 @@ def test_apply_charges_multiple_charges(
     assert set(charge_columns) == expected_ids
 
 
-def test_apply_charges_preserves_usage_columns(hourly_day_usage, simple_energy_charge):
+def test_apply_charges_preserves_usage_columns(hourly_day_usage, energy_only_billing_df):
     """
     Original usage columns unchanged after applying charges.
 
     Expected: Usage data identical before and after
     """
+    result = energy_only_billing_df
+
+    # Check that original columns are preserved
+    pd.testing.assert_frame_equal(result[hourly_day_usage.columns], hourly_day_usage)
+
+
+def test_apply_charges_second_resolution_timestamps(
+    usage_df_factory, simple_energy_charge, simple_demand_charge, simple_customer_charge
+):
+    """
+    Second-resolution timestamps give the same charges as nanosecond ones.
+
+    Expected: Identical charge columns for datetime64[s] and datetime64[ns] usage
+    """
     charges = Tariff(
         energy_charges=(simple_energy_charge,),
-        demand_charges=tuple(),
-        customer_charges=tuple(),
+        demand_charges=(simple_demand_charge,),
+        customer_charges=(simple_customer_charge,),
     )
+    usage_ns = usage_df_factory(start="2024-01-01 00:00:00", periods=24, freq="1h")
+    usage_s = usage_df_factory(start="2024-01-01 00:00:00", periods=24, freq="1h", unit="s")
 
-    result = apply_charges(hourly_day_usage, charges)
+    result_ns = apply_charges(usage_ns, charges)
+    result_s = apply_charges(usage_s, charges)
 
-    # Check that original columns are preserved
-    for col in hourly_day_usage.columns:
-        assert (result[col] == hourly_day_usage[col]).all()
+    charge_columns = result_ns.columns.difference(usage_ns.columns)
+    pd.testing.assert_frame_equal(result_s[charge_columns], result_ns[charge_columns])
 
 
 # Tests for calculate_monthly_bills()
 
 
-def test_calculate_monthly_bills_single_month(hourly_day_usage, simple_energy_charge):
+def test_calculate_monthly_bills_single_month(energy_only_monthly_bills, simple_energy_charge):
     """
     Single month of usage creates one BillingMonthResult.
 
     Expected: One result with correct line items and total
     """
-    charges = Tariff(
-        energy_charges=(simple_energy_charge,),
-        demand_charges=tuple(),
-        customer_charges=tuple(),
-    )
-
-    results, _ = calculate_monthly_bills(hourly_day_usage, charges)
+    results, _ = energy_only_monthly_bills
 
     # Should have exactly 1 monthly result
     assert len(results) == 1
@@ -246,14 +303,14 @@ def test_calculate_monthly_bills_single_month(hourly_day_usage, simple_energy_ch
     assert result.total_usd == energy_item.amount_usd
 
 
-def test_calculate_monthly_bills_multi_month(usage_df_factory, simple_energy_charge):
+def test_calculate_monthly_bills_multi_month(three_month_daily_usage, simple_energy_charge):
     """
     Multi-month usage creates separate results per month.
 
     Expected: One result per month, sorted chronologically
     """
-    # Create 3 months of usage (Jan-Mar 2024)
-    usage = usage_df_factory(start="2024-01-01 00:00:00", periods=90 * 24, freq="1h")
+    # Create 3 months of usage (Jan-Mar 2024); month splitting only needs daily rows
+    usage = three_month_daily_usage
 
     charges = Tariff(
         energy_charges=(simple_energy_charge,),
@@ -368,26 +425,21 @@ def test_calculate_monthly_bills_month_boundary_splitting(usage_df_factory, simp
     assert results[1].total_usd > 0
 
 
-def test_calculate_monthly_bills_returns_billing_df(hourly_day_usage, simple_energy_charge):
+def test_calculate_monthly_bills_returns_billing_df(
+    energy_only_monthly_bills, energy_only_billing_df, simple_energy_charge
+):
     """
     Second return value matches apply_charges() output.
 
     Expected: billing_df has usage columns + charge columns
     """
-    charges = Tariff(
-        energy_charges=(simple_energy_charge,),
-        demand_charges=tuple(),
-        customer_charges=tuple(),
-    )
-
-    _, billing_df = calculate_monthly_bills(hourly_day_usage, charges)
+    _, billing_df = energy_only_monthly_bills
 
     # Should have 9 columns (8 usage + 1 charge)
     assert len(billing_df.columns) == 9
 
     # Should match apply_charges output
-    expected_df = apply_charges(hourly_day_usage, charges)
-    assert set(billing_df.columns) == set(expected_df.columns)
+    pd.testing.assert_frame_equal(billing_df, energy_only_billing_df)
 
     # Verify charge column exists
     charge_col = str(simple_energy_charge.charge_id.value)
@@ -452,8 +504,6 @@ def test_calculate_bills_billing_months_single_calendar_month(
 
     Expected: One BillingMonthResult with one MonthlyBillResult in monthly_breakdowns
     """
-    from billing.core.types import BillingMonthResult
-
     # Create January 2024 usage
     usage = usage_df_factory(start="2024-01-01 00:00:00", periods=31 * 24, freq="1h")
 
@@ -479,28 +529,13 @@ def test_calculate_bills_billing_months_single_calendar_month(
     assert result.total_usd > 0
 
 
-def test_calculate_bills_billing_months_spans_two_months(
-    usage_df_factory, simple_customer_charge
-):
+def test_calculate_bills_billing_months_spans_two_months(jan15_feb14_bills):
     """
     Custom billing month spanning two calendar months with weighted customer charge.
 
     Expected: Customer charge is weighted by days in each calendar month
     """
-    from billing.core.types import BillingMonthResult
-
-    # Create Jan-Feb 2024 usage (60 days)
-    usage = usage_df_factory(start="2024-01-01 00:00:00", periods=60 * 24, freq="1h")
-
-    charges = Tariff(
-        energy_charges=tuple(),
-        demand_charges=tuple(),
-        customer_charges=(simple_customer_charge,),  # $25/month
-    )
-
-    # Billing month is Jan 15 - Feb 14 (31 days: 17 in Jan, 14 in Feb)
-    billing_months = [(date(2024, 1, 15), date(2024, 2, 14))]
-    results, _ = calculate_monthly_bills(usage, charges, billing_months)
+    results, _ = jan15_feb14_bills
 
     assert len(results) == 1
     result = results[0]
@@ -513,31 +548,19 @@ def test_calculate_bills_billing_months_spans_two_months(
     # Expected weighted total: ($25 * 17/31) + ($25 * 14/31) = $25.00
     assert len(result.customer_line_items) == 1
     # The weighted sum should equal the monthly amount since we're spanning exactly one "month" worth of days
-    expected_total = Decimal("25.00")
     # Round to 2 decimal places for comparison (floating point aggregation introduces small errors)
-    assert round(result.customer_line_items[0].amount_usd, 2) == expected_total
+    assert round(result.customer_line_items[0].amount_usd, 2) == _CUSTOMER_AMOUNT
 
 
 def test_calculate_bills_billing_months_energy_not_weighted(
-    usage_df_factory, simple_energy_charge
+    jan15_feb14_bills, simple_energy_charge
 ):
     """
     Energy charges are summed across calendar months, not weighted.
 
     Expected: Energy total is simple sum of all energy charges in the billing month
     """
-    # Create Jan-Feb 2024 usage
-    usage = usage_df_factory(start="2024-01-01 00:00:00", periods=60 * 24, freq="1h")
-
-    charges = Tariff(
-        energy_charges=(simple_energy_charge,),  # $0.10/kWh
-        demand_charges=tuple(),
-        customer_charges=tuple(),
-    )
-
-    # Billing month spans Jan 15 - Feb 14
-    billing_months = [(date(2024, 1, 15), date(2024, 2, 14))]
-    results, billing_df = calculate_monthly_bills(usage, charges, billing_months)
+    results, billing_df = jan15_feb14_bills
 
     result = results[0]
 
@@ -546,8 +569,8 @@ def test_calculate_bills_billing_months_energy_not_weighted(
 
     # Calculate expected energy from the billing dataframe
     charge_col = str(simple_energy_charge.charge_id.value)
-    mask = (billing_df["interval_start"].dt.date >= date(2024, 1, 15)) & (
-        billing_df["interval_start"].dt.date <= date(2024, 2, 14)
+    mask = _date_range_mask(
+        _local_dates(billing_df["interval_start"]), date(2024, 1, 15), date(2024, 2, 14)
     )
     expected_energy = Decimal(str(billing_df.loc[mask, charge_col].sum()))
     assert result.energy_line_items[0].amount_usd == expected_energy
@@ -577,8 +600,6 @@ def test_calculate_bills_billing_months_no_data(usage_df_factory, simple_energy_
 
     Expected: BillingMonthResult with empty line items and $0 total
     """
-    from billing.core.types import BillingMonthResult
-
     # Create January 2024 usage
     usage = usage_df_factory(start="2024-01-01 00:00:00", periods=31 * 24, freq="1h")
 
@@ -601,22 +622,14 @@ def test_calculate_bills_billing_months_no_data(usage_df_factory, simple_energy_
     assert result.total_usd == Decimal("0")
 
 
-def test_calculate_bills_without_billing_months(hourly_day_usage, simple_energy_charge):
+def test_calculate_bills_without_billing_months(energy_only_monthly_bills):
     """
     Without billing_months argument, uses calendar months from usage data.
 
     Expected: List of BillingMonthResult objects aligned to calendar months
     """
-    from billing.core.types import BillingMonthResult
-
-    charges = Tariff(
-        energy_charges=(simple_energy_charge,),
-        demand_charges=tuple(),
-        customer_charges=tuple(),
-    )
-
-    # Call without billing_months - derives calendar months from data
-    results, _ = calculate_monthly_bills(hourly_day_usage, charges)
+    # Computed without billing_months - derives calendar months from data
+    results, _ = energy_only_monthly_bills
 
     assert len(results) == 1
     assert isinstance(results[0], BillingMonthResult)
@@ -625,17 +638,15 @@ def test_calculate_bills_without_billing_months(hourly_day_usage, simple_energy_
 
 
 def test_calculate_bills_billing_months_multiple_periods(
-    usage_df_factory, simple_energy_charge, simple_customer_charge
+    three_month_daily_usage, simple_energy_charge, simple_customer_charge
 ):
     """
     Multiple billing months in one call.
 
     Expected: One BillingMonthResult per billing month
     """
-    from billing.core.types import BillingMonthResult
-
-    # Create 3 months of usage
-    usage = usage_df_factory(start="2024-01-01 00:00:00", periods=90 * 24, freq="1h")
+    # Create 3 months of usage; billing period splitting only needs daily rows
+    usage = three_month_daily_usage
 
     charges = Tariff(
         energy_charges=(simple_energy_charge,),
@@ -660,28 +671,13 @@ def test_calculate_bills_billing_months_multiple_periods(
     assert results[1].period_end == date(2024, 3, 14)
 
 
-def test_calculate_bills_billing_months_demand_weighted(
-    usage_df_factory, simple_demand_charge
-):
+def test_calculate_bills_billing_months_demand_weighted(jan15_feb14_bills):
     """
     Demand charges are calculated for billing periods spanning multiple calendar months.
 
     Expected: Demand charge is calculated from peak demand in the billing period
     """
-    from billing.core.types import BillingMonthResult
-
-    # Create Jan-Feb 2024 usage
-    usage = usage_df_factory(start="2024-01-01 00:00:00", periods=60 * 24, freq="1h")
-
-    charges = Tariff(
-        energy_charges=tuple(),
-        demand_charges=(simple_demand_charge,),  # $15/kW
-        customer_charges=tuple(),
-    )
-
-    # Billing month spans Jan 15 - Feb 14 (31 days: 17 in Jan, 14 in Feb)
-    billing_months = [(date(2024, 1, 15), date(2024, 2, 14))]
-    results, _ = calculate_monthly_bills(usage, charges, billing_months)
+    results, _ = jan15_feb14_bills
 
     assert len(results) == 1
     result = results[0]
@@ -13,6 +13,11 @@ from billing.core.data import (
     validate_usage_dataframe,
 )
 
+_ONE_MINUTE = pd.Timedelta("1min")
+_FIFTEEN_MINUTES = pd.Timedelta("15min")
+_THIRTY_MINUTES = pd.Timedelta("30min")
+_ONE_HOUR = pd.Timedelta("1h")
+
 # Fill Missing Data Tests
 
 
@@ -36,20 +41,16 @@ def test_fills_missing_intervals():
     starts = pd.date_range("2024-01-01", periods=5, freq="15min", tz="US/Pacific")
 
     # Create data with missing interval at index 2
+    present = starts[[0, 1, 3, 4]]  # Skip starts[2]
     df_with_gaps = pd.DataFrame(
         {
-            "interval_start": [starts[0], starts[1], starts[3], starts[4]],  # Skip starts[2]
-            "interval_end": [
-                starts[0] + pd.Timedelta("15min"),
-                starts[1] + pd.Timedelta("15min"),
-                starts[3] + pd.Timedelta("15min"),
-                starts[4] + pd.Timedelta("15min"),
-            ],
+            "interval_start": present,
+            "interval_end": present + _FIFTEEN_MINUTES,
             "kwh": [10.0, 11.0, 13.0, 14.0],
             "kw": [40.0, 44.0, 52.0, 56.0],
-            "is_weekday": [True, True, True, True],
-            "is_weekend": [False, False, False, False],
-            "is_holiday": [False, False, False, False],
+            "is_weekday": np.ones(4, dtype=bool),
+            "is_weekend": np.zeros(4, dtype=bool),
+            "is_holiday": np.zeros(4, dtype=bool),
         }
     )
 
@@ -59,11 +60,11 @@ def test_fills_missing_intervals():
     assert len(result) == 5
 
     # First values should be preserved
-    assert result.iloc[0]["kwh"] == 10.0
-    assert result.iloc[1]["kwh"] == 11.0
+    assert result["kwh"].iat[0] == 10.0
+    assert result["kwh"].iat[1] == 11.0
 
     # Gap-filled value at index 2 should be forward-filled from index 1
-    assert result.iloc[2]["kwh"] == result.iloc[1]["kwh"]
+    assert result["kwh"].iat[2] == result["kwh"].iat[1]
 
 
 def test_fills_nan_values(usage_df_factory):
@@ -80,28 +81,27 @@ def test_fills_nan_values(usage_df_factory):
     assert not result.isna().any().any()
 
     # Values should be forward-filled
-    assert result.iloc[2]["kwh"] == result.iloc[1]["kwh"]
-    assert result.iloc[3]["kw"] == result.iloc[2]["kw"]
+    assert result["kwh"].iat[2] == result["kwh"].iat[1]
+    assert result["kw"].iat[3] == result["kw"].iat[2]
 
 
 def test_infers_interval_duration():
     """Verify correct interval duration inference from mode."""
     # Create mostly 15-min intervals with one 30-min gap
     starts = pd.date_range("2024-01-01", periods=5, freq="15min", tz="US/Pacific")
+    present = starts[[0, 1, 3, 4]]  # Skip starts[2]
     df = pd.DataFrame(
         {
-            "interval_start": [starts[0], starts[1], starts[3], starts[4]],  # Skip starts[2]
-            "interval_end": [
-                starts[0] + pd.Timedelta("15min"),
-                starts[1] + pd.Timedelta("30min"),
-                starts[3] + pd.Timedelta("15min"),
-                starts[4] + pd.Timedelta("15min"),
-            ],
+            "interval_start": present,
+            "interval_end": present
+            + pd.TimedeltaIndex(
+                [_FIFTEEN_MINUTES, _THIRTY_MINUTES, _FIFTEEN_MINUTES, _FIFTEEN_MINUTES]
+            ),
             "kwh": [10.0, 2 * 11.0, 13.0, 14.0],
             "kw": [40.0, 44.0, 52.0, 56.0],
-            "is_weekday": [True, True, True, True],
-            "is_weekend": [False, False, False, False],
-            "is_holiday": [False, False, False, False],
+            "is_weekday": np.ones(4, dtype=bool),
+            "is_weekend": np.zeros(4, dtype=bool),
+            "is_holiday": np.zeros(4, dtype=bool),
         }
     )
 
@@ -112,11 +112,11 @@ def test_infers_interval_duration():
 
     # Check that intervals are evenly spaced at 15 minutes
     diffs = result["interval_start"].diff().dropna()
-    assert (diffs == pd.Timedelta("15min")).all()
+    assert (diffs == _FIFTEEN_MINUTES).all()
 
     # Check that usage in the 30 min interval has been halved in the new intervals
-    assert result.iloc[1]["kwh"] == df.iloc[1]["kwh"] / 2
-    assert result.iloc[2]["kwh"] == df.iloc[1]["kwh"] / 2
+    assert result["kwh"].iat[1] == df["kwh"].iat[1] / 2
+    assert result["kwh"].iat[2] == df["kwh"].iat[1] / 2
 
 
 def test_handles_duplicate_starts(usage_df_factory):
@@ -126,7 +126,7 @@ def test_handles_duplicate_starts(usage_df_factory):
     # Add a duplicate row with different value
     duplicate_row = df.iloc[1].copy()
     duplicate_row["kwh"] = 99.9
-    df = pd.concat([df, pd.DataFrame([duplicate_row])]).reset_index(drop=True)
+    df.loc[len(df)] = duplicate_row
 
     result = fill_missing_data(df)
 
@@ -134,7 +134,7 @@ def test_handles_duplicate_starts(usage_df_factory):
     assert len(result) == 4
 
     # Should keep the last occurrence (99.9)
-    assert result.iloc[1]["kwh"] == 99.9
+    assert result["kwh"].iat[1] == 99.9
 
 
 def test_rejects_overlapping_intervals(usage_df_factory):
@@ -142,7 +142,7 @@ def test_rejects_overlapping_intervals(usage_df_factory):
     df = usage_df_factory(periods=4)
 
     # Mess up interval_end values
-    df.loc[1, "interval_end"] = df.loc[1, "interval_start"] + pd.Timedelta("30min")
+    df.loc[1, "interval_end"] = df.loc[1, "interval_start"] + _THIRTY_MINUTES
 
     with pytest.raises(ValueError) as exc_info:
         _ = fill_missing_data(df)
@@ -168,7 +168,7 @@ def test_single_interval_complete_returns_unchanged(usage_df_factory):
     result = fill_missing_data(df)
 
     assert len(result) == 1
-    assert result.iloc[0]["kwh"] == 10.5
+    assert result["kwh"].iat[0] == 10.5
 
 
 def test_fill_misssing_data_missing_required_columns_raises_error():
@@ -184,6 +184,17 @@ def test_fill_misssing_data_missing_required_columns_raises_error():
         fill_missing_data(df)
 
 
+def test_missing_timestamps_raise_error(usage_df_factory):
+    """Verify error when interval_start or interval_end contains NaT."""
+    df = usage_df_factory(periods=4)
+    df.loc[2, "interval_end"] = pd.NaT
+
+    with pytest.raises(ValueError) as exc_info:
+        fill_missing_data(df)
+
+    assert "missing timestamps" in str(exc_info.value)
+
+
 def test_timezone_aware_datetimes(usage_df_factory):
     """Verify function preserves timezone information."""
     df = usage_df_factory(periods=3, tz="US/Pacific")
@@ -196,6 +207,27 @@ def test_timezone_aware_datetimes(usage_df_factory):
     assert str(result["interval_start"].dt.tz) == "US/Pacific"
 
 
+def test_fills_missing_intervals_across_dst_transition():
+    """Verify gaps spanning the spring-forward transition are filled on the UTC grid."""
+    # DST spring forward in US/Pacific: 2024-03-10 02:00 -> 03:00
+    starts = pd.date_range("2024-03-10 00:00:00", periods=6, freq="1h", tz="US/Pacific")
+    df = pd.DataFrame(
+        {
+            "interval_start": starts,
+            "interval_end": starts + _ONE_HOUR,
+            "kwh": [1.0, 2.0, 3.0, 4.0, 5.0, 6.0],
+            "kw": 4.0,
+        }
+    ).drop([2, 3])
+
+    result = fill_missing_data(df)
+
+    pd.testing.assert_series_equal(
+        result["interval_start"], pd.Series(starts, name="interval_start"), check_dtype=False
+    )
+    assert result["kwh"].tolist() == [1.0, 2.0, 2.0, 2.0, 5.0, 6.0]
+
+
 # Validate Usage DataFrame Tests
 
 
@@ -258,7 +290,7 @@ def test_interval_end_before_start_raises_error(usage_df_factory):
     df = usage_df_factory(periods=3)
 
     # Swap start and end for one row
-    df.loc[1, "interval_end"] = df.loc[1, "interval_start"] - pd.Timedelta("1min")
+    df.loc[1, "interval_end"] = df.loc[1, "interval_start"] - _ONE_MINUTE
 
     with pytest.raises(ValueError) as exc_info:
         validate_usage_dataframe(df)
@@ -271,8 +303,7 @@ def test_duplicate_interval_starts_raises_error(usage_df_factory):
     df = usage_df_factory(periods=4)
 
     # Duplicate the second row
-    duplicate_row = df.iloc[1].copy()
-    df = pd.concat([df, pd.DataFrame([duplicate_row])]).reset_index(drop=True)
+    df.loc[len(df)] = df.iloc[1]
 
     with pytest.raises(ValueError) as exc_info:
         validate_usage_dataframe(df)
@@ -286,17 +317,20 @@ def test_inconsistent_interval_widths_raises_error():
     df = pd.DataFrame(
         {
             "interval_start": starts,
-            "interval_end": [
-                starts[0] + pd.Timedelta("15min"),
-                starts[1] + pd.Timedelta("15min"),
-                starts[2] + pd.Timedelta("30min"),  # Different width
-                starts[3] + pd.Timedelta("15min"),
-            ],
+            "interval_end": starts
+            + pd.TimedeltaIndex(
+                [
+                    _FIFTEEN_MINUTES,
+                    _FIFTEEN_MINUTES,
+                    _THIRTY_MINUTES,  # Different width
+                    _FIFTEEN_MINUTES,
+                ]
+            ),
             "kwh": 10.5,
             "kw": 42.0,
-            "is_weekday": [True] * 4,
-            "is_weekend": [False] * 4,
-            "is_holiday": [False] * 4,
+            "is_weekday": np.ones(4, dtype=bool),
+            "is_weekend": np.zeros(4, dtype=bool),
+            "is_holiday": np.zeros(4, dtype=bool),
         }
     )
 
@@ -345,12 +379,12 @@ def test_dst_transition_handling():
     df = pd.DataFrame(
         {
             "interval_start": starts,
-            "interval_end": starts + pd.Timedelta("1h"),
+            "interval_end": starts + _ONE_HOUR,
             "kwh": 10.5,
             "kw": 42.0,
-            "is_weekday": [True] * len(starts),
-            "is_weekend": [False] * len(starts),
-            "is_holiday": [False] * len(starts),
+            "is_weekday": np.ones(len(starts), dtype=bool),
+            "is_weekend": np.zeros(len(starts), dtype=bool),
+            "is_holiday": np.zeros(len(starts), dtype=bool),
         }
     )
 
@@ -0,0 +1,40 @@
+"""
+Unit tests for billing services.
+
+Tests day type labelling of usage data.
+"""
+
+import zoneinfo
+from datetime import date
+
+import pandas as pd
+
+from billing.services import determine_day_types
+from utilities.models import Holiday
+
+_PACIFIC = zoneinfo.ZoneInfo("US/Pacific")
+
+
+def test_determine_day_types_uses_local_dates(utility):
+    """Day types follow the local date, which differs from the UTC date in the evening."""
+    Holiday.objects.create(utility=utility, name="Independence Day", date=date(2024, 7, 4))
+
+    # 20:00 PDT is 03:00 UTC on the following day
+    df = pd.DataFrame(
+        {
+            "interval_start": pd.to_datetime(
+                [
+                    "2024-07-04 20:00",  # Thursday holiday (Friday in UTC)
+                    "2024-07-05 20:00",  # Friday (Saturday in UTC)
+                    "2024-07-07 20:00",  # Sunday (Monday in UTC)
+                    "2024-07-08 20:00",  # Monday (Tuesday in UTC)
+                ]
+            ).tz_localize("US/Pacific")
+        }
+    )
+
+    result = determine_day_types(df, utility, _PACIFIC)
+
+    assert result["is_holiday"].tolist() == [True, False, False, False]
+    assert result["is_weekend"].tolist() == [False, False, True, False]
+    assert result["is_weekday"].tolist() == [False, True, False, True]
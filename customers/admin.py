@@ -1,8 +1,9 @@
+import io
 import json
 import logging
 
 from django.contrib import admin
-from django.http import HttpResponse
+from django.http import StreamingHttpResponse
 from django.shortcuts import render
 from django.urls import path
 
@@ -76,11 +77,11 @@ class CustomerAdmin(admin.ModelAdmin):
                 csv_file = form.cleaned_data["csv_file"]
                 replace_existing = form.cleaned_data["replace_existing"]
 
-                # Read file content
-                csv_content = csv_file.read().decode("utf-8")
+                # Decode the upload as it is read rather than loading it all into memory
+                csv_stream = io.TextIOWrapper(csv_file, encoding="utf-8", newline="")
 
                 # Import customers
-                importer = CustomerCSVImporter(csv_content, replace_existing=replace_existing)
+                importer = CustomerCSVImporter(csv_stream, replace_existing=replace_existing)
                 results = importer.import_customers()
 
                 # Render results page
@@ -104,11 +105,9 @@ class CustomerAdmin(admin.ModelAdmin):
 
     def export_customers_view(self, request):
         """Export all customers as CSV download."""
-        customers = Customer.objects.all()
-        exporter = CustomerCSVExporter(customers)
-        csv_str = exporter.export_to_csv()
+        exporter = CustomerCSVExporter(Customer.objects.all())
 
-        response = HttpResponse(csv_str, content_type="text/csv")
+        response = StreamingHttpResponse(exporter.iter_csv(), content_type="text/csv")
         response["Content-Disposition"] = 'attachment; filename="customers.csv"'
         return response
 
@@ -116,9 +115,8 @@ class CustomerAdmin(admin.ModelAdmin):
     def export_selected_customers_to_csv(self, request, queryset):
         """Export selected customers as CSV download."""
         exporter = CustomerCSVExporter(queryset)
-        csv_str = exporter.export_to_csv()
 
-        response = HttpResponse(csv_str, content_type="text/csv")
+        response = StreamingHttpResponse(exporter.iter_csv(), content_type="text/csv")
         response["Content-Disposition"] = 'attachment; filename="customers_selected.csv"'
         return response
 
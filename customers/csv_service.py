@@ -8,6 +8,8 @@ bulk customer uploads and downloads via CSV format.
 import csv
 import io
 import zoneinfo
+from collections.abc import Iterator
+from typing import TextIO
 
 from django.core.exceptions import ValidationError
 from django.db import transaction
@@ -16,9 +18,18 @@ from customers.models import Customer
 from tariffs.models import Tariff
 
 
+class _Echo:
+    """Pseudo-buffer whose write() returns the line, so csv writers can yield rows."""
+
+    def write(self, value: str) -> str:
+        return value
+
+
 class CustomerCSVExporter:
     """Export customers to CSV format."""
 
+    fieldnames = ["name", "timezone", "utility_name", "tariff_name"]
+
     def __init__(self, customers_queryset):
         """
         Initialize exporter with customers queryset.
@@ -26,23 +37,29 @@ class CustomerCSVExporter:
         Args:
             customers_queryset: Django queryset of Customer objects to export
         """
-        self.customers = customers_queryset.select_related("current_tariff__utility")
+        self.customers = customers_queryset.select_related("current_tariff__utility").only(
+            "name", "timezone", "current_tariff__name", "current_tariff__utility__name"
+        )
 
-    def export_to_csv(self) -> str:
+    def iter_csv(self, chunk_size: int = 1000) -> Iterator[str]:
         """
-        Export customers to CSV string.
+        Export customers as CSV lines, one at a time.
 
-        Returns:
-            CSV string representation of customers with header row
+        Customers are fetched in chunks with a single query, so large exports can be
+        streamed without holding every row in memory.
+
+        Args:
+            chunk_size: Number of customers fetched from the database at a time
+
+        Yields:
+            The CSV header line, then one line per customer
         """
-        output = io.StringIO()
-        fieldnames = ["name", "timezone", "utility_name", "tariff_name"]
-        writer = csv.DictWriter(output, fieldnames=fieldnames, quoting=csv.QUOTE_MINIMAL)
+        writer = csv.DictWriter(_Echo(), fieldnames=self.fieldnames, quoting=csv.QUOTE_MINIMAL)
 
-        writer.writeheader()
+        yield writer.writeheader()
 
-        for customer in self.customers:
-            writer.writerow(
+        for customer in self.customers.iterator(chunk_size=chunk_size):
+            yield writer.writerow(
                 {
                     "name": customer.name,
                     "timezone": str(customer.timezone),
@@ -51,22 +68,30 @@ class CustomerCSVExporter:
                 }
             )
 
-        return output.getvalue()
+    def export_to_csv(self) -> str:
+        """
+        Export customers to CSV string.
+
+        Returns:
+            CSV string representation of customers with header row
+        """
+        return "".join(self.iter_csv())
 
 
 class CustomerCSVImporter:
     """Import customers from CSV format with validation."""
 
-    def __init__(self, csv_content: str, replace_existing: bool = False):
+    def __init__(self, csv_content: str | TextIO, replace_existing: bool = False):
         """
         Initialize importer with CSV content.
 
         Args:
-            csv_content: CSV string to parse and import
+            csv_content: CSV string to parse and import, or a seekable text stream to read
+                it from (e.g. an uploaded file wrapped in io.TextIOWrapper)
             replace_existing: If True, update existing customers with same name.
                             If False, skip existing customers.
         """
-        self.csv_content = csv_content
+        self.csv_stream = io.StringIO(csv_content) if isinstance(csv_content, str) else csv_content
         self.replace_existing = replace_existing
         self.results = {
             "created": [],  # [customer, ...]
@@ -83,43 +108,56 @@ class CustomerCSVImporter:
             Dictionary with results structure containing created, updated, skipped, and errors
         """
         try:
-            rows = self._parse_csv()
+            row_count = self._check_csv()
         except Exception as e:
             self.results["errors"].append(("CSV File", [str(e)]))
             return self.results
 
-        if not rows:
+        if not row_count:
             self.results["errors"].append(("CSV File", ["No data rows found in CSV file"]))
             return self.results
 
         # Import each customer in its own transaction
-        for row_num, row_data in enumerate(rows, start=2):  # Start at 2 (header is row 1)
+        for row_num, row_data in enumerate(self._read_csv(), start=2):  # Header is row 1
             self._import_single_customer(row_data, row_num)
 
         return self.results
 
-    def _parse_csv(self) -> list[dict]:
+    def _check_csv(self) -> int:
         """
-        Parse CSV content with error handling.
+        Parse the whole CSV once without keeping its rows.
+
+        Syntax errors are found before any customer is imported, while memory use stays
+        independent of the file size.
 
         Returns:
-            List of dictionaries representing CSV rows
+            Number of data rows in the CSV
 
         Raises:
             ValueError: If CSV syntax is invalid or schema is wrong
         """
         try:
-            reader = csv.DictReader(io.StringIO(self.csv_content))
+            return sum(1 for _ in self._read_csv())
+        except csv.Error as e:
+            raise ValueError(f"Invalid CSV syntax: {str(e)}")
+
+    def _read_csv(self) -> csv.DictReader:
+        """
+        Rewind the CSV stream and open a validated reader over it.
 
-            # Validate header
-            self._validate_schema(reader)
+        Returns:
+            CSV DictReader positioned at the first data row
 
-            # Convert to list to catch any parsing errors
-            rows = list(reader)
-            return rows
+        Raises:
+            ValueError: If schema is wrong
+        """
+        self.csv_stream.seek(0)
+        reader = csv.DictReader(self.csv_stream)
 
-        except csv.Error as e:
-            raise ValueError(f"Invalid CSV syntax: {str(e)}")
+        # Validate header
+        self._validate_schema(reader)
+
+        return reader
 
     def _validate_schema(self, reader: csv.DictReader):
         """
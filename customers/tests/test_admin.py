@@ -7,7 +7,10 @@ from decimal import Decimal
 from unittest.mock import patch
 
 from django.contrib.auth.models import User
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 
@@ -271,3 +274,127 @@ class CustomerAdminChartTests(TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, "2024-01-01")
         self.assertContains(response, "2024-01-31")
+
+
+class CustomerAdminChangelistTests(TestCase):
+    """Test the customer admin changelist."""
+
+    def setUp(self):
+        """Create admin user, tariff and one customer."""
+        self.admin_user = User.objects.create_superuser(
+            username="admin", email="admin@test.com", password="admin123"
+        )
+        utility = Utility.objects.create(name="Test Utility")
+        self.tariff = Tariff.objects.create(name="Test Tariff", utility=utility)
+        Customer.objects.create(
+            name="Customer 0", timezone="America/Los_Angeles", current_tariff=self.tariff
+        )
+
+    def _changelist_query_count(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("admin:customers_customer_changelist"))
+        self.assertEqual(response.status_code, 200)
+        return len(queries)
+
+    def test_changelist_query_count_independent_of_customers(self):
+        """Test utility and tariff columns do not cost a query per customer row."""
+        # Login as admin
+        self.client.login(username="admin", password="admin123")
+        one_customer = self._changelist_query_count()
+
+        for i in range(1, 5):
+            Customer.objects.create(
+                name=f"Customer {i}", timezone="America/Los_Angeles", current_tariff=self.tariff
+            )
+
+        self.assertEqual(self._changelist_query_count(), one_customer)
+
+
+class CustomerAdminExportTests(TestCase):
+    """Test CSV export from the customer admin."""
+
+    def setUp(self):
+        """Create admin user and customers to export."""
+        self.admin_user = User.objects.create_superuser(
+            username="admin", email="admin@test.com", password="admin123"
+        )
+        utility = Utility.objects.create(name="Test Utility")
+        tariff = Tariff.objects.create(name="Test Tariff", utility=utility)
+        for name in ["Customer A", "Customer B"]:
+            Customer.objects.create(
+                name=name, timezone="America/Los_Angeles", current_tariff=tariff
+            )
+
+    def test_export_streams_csv(self):
+        """Test export view streams every customer as a CSV attachment."""
+        # Login as admin
+        self.client.login(username="admin", password="admin123")
+
+        response = self.client.get(reverse("admin:customers_customer_export"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "text/csv")
+        self.assertEqual(response["Content-Disposition"], 'attachment; filename="customers.csv"')
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        self.assertEqual(
+            lines,
+            [
+                "name,timezone,utility_name,tariff_name",
+                "Customer A,America/Los_Angeles,Test Utility,Test Tariff",
+                "Customer B,America/Los_Angeles,Test Utility,Test Tariff",
+            ],
+        )
+
+
+class CustomerAdminImportTests(TestCase):
+    """Test CSV import from the customer admin."""
+
+    def setUp(self):
+        """Create admin user and the tariff referenced by the upload."""
+        self.admin_user = User.objects.create_superuser(
+            username="admin", email="admin@test.com", password="admin123"
+        )
+        self.utility = Utility.objects.create(name="PG&E")
+        self.tariff = Tariff.objects.create(name="B-19", utility=self.utility)
+
+    def test_import_decodes_uploaded_file(self):
+        """Test uploaded UTF-8 CSV is decoded and imported."""
+        # Login as admin
+        self.client.login(username="admin", password="admin123")
+
+        csv_file = SimpleUploadedFile(
+            "customers.csv",
+            "name,timezone,utility_name,tariff_name\r\n"
+            "Café François,America/Chicago,PG&E,B-19\r\n".encode(),
+            content_type="text/csv",
+        )
+        response = self.client.post(
+            reverse("admin:customers_customer_import"), {"csv_file": csv_file}
+        )
+
+        self.assertEqual(response.status_code, 200)
+        customer = Customer.objects.get(name="Café François")
+        self.assertEqual(str(customer.timezone), "America/Chicago")
+        self.assertEqual(customer.current_tariff, self.tariff)
+
+    def test_import_reports_invalid_utf8(self):
+        """Test non-UTF-8 upload is reported as a CSV File error."""
+        self.client.login(username="admin", password="admin123")
+
+        csv_file = SimpleUploadedFile(
+            "customers.csv",
+            "name,timezone,utility_name,tariff_name\r\n"
+            "Café François,America/Chicago,PG&E,B-19\r\n".encode("latin-1"),
+            content_type="text/csv",
+        )
+        response = self.client.post(
+            reverse("admin:customers_customer_import"), {"csv_file": csv_file}
+        )
+
+        self.assertEqual(response.status_code, 200)
+        errors = response.context["results"]["errors"]
+        self.assertEqual(len(errors), 1)
+        self.assertEqual(errors[0][0], "CSV File")
+        self.assertIn("utf-8", errors[0][1][0])
+        self.assertFalse(Customer.objects.exists())
@@ -60,6 +60,20 @@ class CustomerCSVExporterTests(TestCase):
         self.assertIn("PG&E", csv_str)
         self.assertIn("B-19", csv_str)
 
+    def test_export_fetches_related_names_in_one_query(self):
+        """Test exporting looks up tariff and utility names without a query per customer."""
+        for name in ["Customer A", "Customer B", "Customer C"]:
+            Customer.objects.create(
+                name=name, timezone="America/Los_Angeles", current_tariff=self.tariff
+            )
+
+        exporter = CustomerCSVExporter(Customer.objects.all())
+        with self.assertNumQueries(1):
+            lines = list(exporter.iter_csv())
+
+        self.assertEqual(len(lines), 4)  # Header + 3 customers
+        self.assertEqual(lines[1], "Customer A,America/Los_Angeles,PG&E,B-19\r\n")
+
     def test_export_empty_queryset(self):
         """Test exporting empty queryset."""
         customers = Customer.objects.none()